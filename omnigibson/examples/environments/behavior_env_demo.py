@@ -1,9 +1,8 @@
 import os
 
-import yaml
-
 import omnigibson as og
 from omnigibson.macros import gm
+from omnigibson.utils.config_utils import parse_config
 from omnigibson.utils.ui_utils import choose_from_options
 
 # Make sure object states are enabled
@@ -28,7 +27,7 @@ def main(random_selection=False, headless=False, short_exec=False):
 
     # Load the pre-selected configuration and set the online_sampling flag
     config_filename = os.path.join(og.example_config_path, "fetch_behavior.yaml")
-    cfg = yaml.load(open(config_filename, "r"), Loader=yaml.FullLoader)
+    cfg = parse_config(config_filename)
     cfg["task"]["online_object_sampling"] = should_sample
 
     # Load the environment
@@ -1,8 +1,7 @@
 import os
 
-import yaml
-
 import omnigibson as og
+from omnigibson.utils.config_utils import parse_config
 from omnigibson.utils.ui_utils import choose_from_options
 
 
@@ -18,7 +17,7 @@ def main(random_selection=False, headless=False, short_exec=False):
 
     # Load the config
     config_filename = os.path.join(og.example_config_path, f"turtlebot_nav.yaml")
-    config = yaml.load(open(config_filename, "r"), Loader=yaml.FullLoader)
+    config = parse_config(config_filename)
 
     # check if we want to quick load or full load the scene
     load_options = {
@@ -6,11 +6,11 @@ This only serves as a starting point that users can further build upon.
 
 import argparse
 import os, time, cv2
-import yaml
 
 import omnigibson as og
 from omnigibson import example_config_path
 from omnigibson.macros import gm
+from omnigibson.utils.config_utils import parse_config
 from omnigibson.utils.python_utils import meets_minimum_version
 
 try:
@@ -116,8 +116,7 @@ def main():
     seed = 0
 
     # Load config
-    with open(f"{example_config_path}/turtlebot_nav.yaml", "r") as f:
-        cfg = yaml.load(f, Loader=yaml.FullLoader)
+    cfg = parse_config(f"{example_config_path}/turtlebot_nav.yaml")
 
     # Only use RGB obs
     cfg["robots"][0]["obs_modalities"] = ["rgb"]
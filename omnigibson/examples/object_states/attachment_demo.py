@@ -1,8 +1,8 @@
-import yaml
 import numpy as np
 
 import omnigibson as og
 from omnigibson.macros import gm
+from omnigibson.utils.config_utils import load_default_config
 
 # Make sure object states are enabled
 gm.ENABLE_OBJECT_STATES = True
@@ -11,7 +11,7 @@ def main(random_selection=False, headless=False, short_exec=False):
     """
     Demo of attachment of different parts of a shelf
     """
-    cfg = yaml.load(open(f"{og.example_config_path}/default_cfg.yaml", "r"), Loader=yaml.FullLoader)
+    cfg = load_default_config()
     # Add objects that we want to create
     obj_cfgs = []
     obj_cfgs.append(dict(
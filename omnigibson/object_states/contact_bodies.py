@@ -5,21 +5,37 @@ from omnigibson.utils.sim_utils import prims_to_rigid_prim_set
 
 class ContactBodies(AbsoluteObjectState):
 
+    def __init__(self, obj):
+        # Run super first
+        super().__init__(obj)
+
+        # Set internal values
+        self._link_prim_paths = None
+
+    def _initialize(self):
+        super()._initialize()
+        # Cache the set of this object's own link prim paths, since these do not change once the object is loaded
+        self._link_prim_paths = set(self.obj.link_prim_paths)
+
     def _get_value(self, ignore_objs=None):
+        # Ignore_objs should either be None or tuple (CANNOT be list because we need to hash these inputs)
+        assert ignore_objs is None or isinstance(ignore_objs, tuple), \
+            "ignore_objs must either be None or a tuple of objects to ignore!"
+        if ignore_objs is not None:
+            # Filter the (cached) unfiltered contact set, so the raw contacts are only gathered once per step no matter
+            # how many different ignore_objs combinations are queried
+            return self.get_value() - prims_to_rigid_prim_set(ignore_objs)
+
         # Compute bodies in contact, minus the self-owned bodies
-        bodies = set()
-        for contact in self.obj.contact_list():
-            bodies.update({contact.body0, contact.body1})
-        bodies -= set(self.obj.link_prim_paths)
+        # We gather the body0 and body1 columns directly, rather than building a temporary set for every contact
+        contacts = self.obj.contact_list()
+        bodies = {contact.body0 for contact in contacts}
+        bodies.update(contact.body1 for contact in contacts)
+        bodies -= self._link_prim_paths
         rigid_prims = set()
         for body in bodies:
-            tokens = body.split("/")
-            obj_prim_path = "/".join(tokens[:-1])
-            link_name = tokens[-1]
+            obj_prim_path, _, link_name = body.rpartition("/")
             obj = og.sim.scene.object_registry("prim_path", obj_prim_path)
             if obj is not None:
                 rigid_prims.add(obj.links[link_name])
-        # Ignore_objs should either be None or tuple (CANNOT be list because we need to hash these inputs)
-        assert ignore_objs is None or isinstance(ignore_objs, tuple), \
-            "ignore_objs must either be None or a tuple of objects to ignore!"
-        return rigid_prims if ignore_objs is None else rigid_prims - prims_to_rigid_prim_set(ignore_objs)
+        return rigid_prims
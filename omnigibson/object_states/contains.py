@@ -64,9 +64,7 @@ class ContainedParticles(RelativeObjectState, LinkBasedStateMixin):
                 if self._visual_particle_group in system.groups:
                     # Grab global particle poses and offset them in the direction of their orientation
                     raw_positions, quats = system.get_group_particles_position_orientation(group=self._visual_particle_group)
-                    unit_z = np.zeros((len(raw_positions), 3, 1))
-                    unit_z[:, -1, :] = m.VISUAL_PARTICLE_OFFSET
-                    checked_positions = (T.quat2mat(quats) @ unit_z).reshape(-1, 3) + raw_positions
+                    checked_positions = T.quat_apply(quats, np.array([0, 0, m.VISUAL_PARTICLE_OFFSET])) + raw_positions
             elif is_physical_particle_system(system_name=system.name):
                 raw_positions = system.get_particles_position_orientation()[0]
                 checked_positions = raw_positions
@@ -1,3 +1,4 @@
+import math
 import numpy as np
 
 from omnigibson.object_states.aabb import AABB
@@ -26,12 +27,14 @@ class NextTo(KinematicsMixin, RelativeObjectState, BooleanStateMixin):
 
         objA_lower, objA_upper = objA_aabb
         objB_lower, objB_upper = objB_aabb
-        distance_vec = []
+        # Accumulate the squared per-axis gaps as scalars, rather than building an array just to take its norm
+        distance_sq = 0.0
         for dim in range(3):
             glb = max(objA_lower[dim], objB_lower[dim])
             lub = min(objA_upper[dim], objB_upper[dim])
-            distance_vec.append(max(0, glb - lub))
-        distance = np.linalg.norm(np.array(distance_vec))
+            gap = max(0, glb - lub)
+            distance_sq += gap * gap
+        distance = math.sqrt(distance_sq)
         objA_dims = objA_upper - objA_lower
         objB_dims = objB_upper - objB_lower
         avg_aabb_length = np.mean(objA_dims + objB_dims)
@@ -291,10 +291,15 @@ class BaseObjectState(Serializable, Registerable, Recreatable, ABC):
 
         # Compile args and kwargs deterministically
         key = (*args, *tuple(kwargs.values()))
+        # Fast path: the value has already been computed at the current timestep, so return it with a single lookup
+        entry = self._cache.get(key, None)
+        if entry is not None and entry["t"] == og.sim.current_time_step_index:
+            return entry["value"]
+
         # We need to see if we need to update our cache -- we do so if and only if one of the following conditions are met:
         # (a) key is NOT in the cache
         # (b) Our cache is not valid
-        if key not in self._cache or not self.cache_is_valid(get_value_args=key):
+        if entry is None or not self.cache_is_valid(get_value_args=key):
             # Update the cache
             self.update_cache(get_value_args=key)
 
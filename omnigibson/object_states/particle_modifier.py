@@ -348,7 +348,7 @@ class ParticleModifier(IntrinsicObjectState, LinkBasedStateMixin, UpdateStateMix
 
             self.projection_mesh.set_local_pose(
                 translation=np.array([0, 0, -z_offset]),
-                orientation=T.euler2quat([0, 0, 0]),
+                orientation=np.array([0, 0, 0, 1.0]),
             )
 
             # Generate the function for checking whether points are within the projection mesh
@@ -515,26 +515,31 @@ class ParticleModifier(IntrinsicObjectState, LinkBasedStateMixin, UpdateStateMix
         if self.method == ParticleModifyMethod.PROJECTION and gm.ENABLE_FLATCACHE:
             FlatcacheAPI.sync_raw_object_transforms_in_usd(prim=self.obj)
 
-        # Check if there's any overlap and if we're at the correct step
-        if self._current_step == 0 and (not self.requires_overlap or self._check_overlap()):
-            # Iterate over all owned systems for this particle modifier
+        # Check if we're at the correct step
+        if self._current_step == 0:
+            # Find all owned systems for this particle modifier that are active and whose conditions are all met.
+            # These are checked before the overlap, so that the (much more expensive) overlap query can be skipped
+            # entirely when no system can be modified, e.g.: when this object is already saturated
+            systems = []
             for system_name, conditions in self.conditions.items():
                 # Check if the system is active (for ParticleApplier, the system is always active)
-                if is_system_active(system_name):
-                    # Check if all conditions are met
-                    if np.all([condition(self.obj) for condition in conditions]):
-                        system = get_system(system_name)
-                        # Update saturation limit if it's not specified yet
-                        limit = self.visual_particle_modification_limit \
-                            if is_visual_particle_system(system_name=system.name) \
-                            else self.physical_particle_modification_limit
-                        if system not in self.obj.states[Saturated].limits:
-                            self.obj.states[Saturated].set_limit(system=system, limit=limit)
-                        # Sanity check for oversaturation
-                        if self.obj.states[Saturated].get_value(system=system):
-                            continue
-                        # Potentially modify particles within the volume
-                        self._modify_particles(system=system)
+                if is_system_active(system_name) and all(condition(self.obj) for condition in conditions):
+                    systems.append(get_system(system_name))
+
+            # Check if there's any overlap
+            if len(systems) > 0 and (not self.requires_overlap or self._check_overlap()):
+                for system in systems:
+                    # Update saturation limit if it's not specified yet
+                    limit = self.visual_particle_modification_limit \
+                        if is_visual_particle_system(system_name=system.name) \
+                        else self.physical_particle_modification_limit
+                    if system not in self.obj.states[Saturated].limits:
+                        self.obj.states[Saturated].set_limit(system=system, limit=limit)
+                    # Sanity check for oversaturation
+                    if self.obj.states[Saturated].get_value(system=system):
+                        continue
+                    # Potentially modify particles within the volume
+                    self._modify_particles(system=system)
 
         # Update the current step
         self._current_step = (self._current_step + 1) % self.n_steps_per_modification
@@ -948,7 +953,7 @@ class ParticleApplier(ParticleModifier):
         # If we're about to check for modification, update whether it the visualization should be active or not
         if self.visualize and self._current_step == 0:
             # Only one system in our conditions, so next(iter()) suffices
-            is_active = bool(np.all([condition(self.obj) for condition in next(iter(self.conditions.values()))]))
+            is_active = all(condition(self.obj) for condition in next(iter(self.conditions.values())))
             self.projection_emitter.GetProperty("inputs:active").Set(is_active)
 
         # Run super
@@ -67,14 +67,11 @@ class ModifiedParticles(RelativeObjectState):
         self.particle_counts = {REGISTERED_SYSTEMS[system_name]: val for system_name, val in state.items() if system_name != "n_systems" and val > 0}
 
     def _serialize(self, state):
-        state_flat = np.array([state["n_systems"]], dtype=float)
-        if state["n_systems"] > 0:
-            system_names = tuple(state.keys())[1:]
-            state_flat = np.concatenate(
-                [state_flat,
-                 np.concatenate([(get_uuid(system_name), state[system_name]) for system_name in system_names])]
-            ).astype(float)
-        return state_flat
+        # Flatten into a single list first so that only one array is allocated
+        state_flat = [state["n_systems"]]
+        for system_name in tuple(state.keys())[1:]:
+            state_flat += [get_uuid(system_name), state[system_name]]
+        return np.array(state_flat, dtype=float)
 
     def _deserialize(self, state):
         n_systems = int(state[0])
@@ -215,14 +212,11 @@ class Saturated(RelativeObjectState, BooleanStateMixin):
                 self._limits[REGISTERED_SYSTEMS[k]] = v
 
     def _serialize(self, state):
-        state_flat = np.array([state["n_systems"], state["default_limit"]], dtype=float)
-        if state["n_systems"] > 0:
-            system_names = tuple(state.keys())[2:]
-            state_flat = np.concatenate(
-                [state_flat,
-                 np.concatenate([(get_uuid(system_name), state[system_name]) for system_name in system_names])]
-            ).astype(float)
-        return state_flat
+        # Flatten into a single list first so that only one array is allocated
+        state_flat = [state["n_systems"], state["default_limit"]]
+        for system_name in tuple(state.keys())[2:]:
+            state_flat += [get_uuid(system_name), state[system_name]]
+        return np.array(state_flat, dtype=float)
 
     def _deserialize(self, state):
         n_systems = int(state[0])
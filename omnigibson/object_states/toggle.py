@@ -27,6 +27,7 @@ class ToggledOn(AbsoluteObjectState, BooleanStateMixin, LinkBasedStateMixin, Upd
         self.value = False
         self.robot_can_toggle_steps = 0
         self.visual_marker = None
+        self._visual_marker_value = None    # Toggled value currently reflected by the visual marker's color
         self._check_overlap = None
         self._robot_link_paths = None
 
@@ -114,8 +115,12 @@ class ToggledOn(AbsoluteObjectState, BooleanStateMixin, LinkBasedStateMixin, Upd
         if self.robot_can_toggle_steps == m.CAN_TOGGLE_STEPS:
             self.value = not self.value
 
-        # Choose which color to apply to the toggle marker
-        self.visual_marker.color = np.array([0, 1.0, 0]) if self.get_value() else np.array([1.0, 0, 0])
+        # Choose which color to apply to the toggle marker. This writes to the USD stage, so only do so when the
+        # toggled value has actually changed
+        value = self.get_value()
+        if value != self._visual_marker_value:
+            self.visual_marker.color = np.array([0, 1.0, 0]) if value else np.array([1.0, 0, 0])
+            self._visual_marker_value = value
 
     @staticmethod
     def get_texture_change_params():
@@ -9,7 +9,7 @@ class Touching(KinematicsMixin, RelativeObjectState, BooleanStateMixin):
 
     @staticmethod
     def _check_contact(obj_a, obj_b):
-        return len(set(obj_a.links.values()) & obj_b.states[ContactBodies].get_value()) > 0
+        return not obj_b.states[ContactBodies].get_value().isdisjoint(obj_a.links.values())
 
     def _get_value(self, other):
         if self.obj.prim_type == PrimType.CLOTH and other.prim_type == PrimType.CLOTH:
@@ -88,6 +88,9 @@ class ControllableObject(BaseObject):
         self._dof_to_joints = None          # dict that will map DOF indices to JointPrims
         self._last_action = None
         self._controllers = None
+        self._controller_action_idx = None  # dict mapping controller names to action indices, filled on controller load
+        self._controller_joint_idx = None   # dict mapping controller names to joint indices, filled on controller load
+        self._action_dim = None
         self.dof_names_ordered = None
 
         # Run super init
@@ -179,6 +182,19 @@ class ControllableObject(BaseObject):
             for idx in controller.dof_idx:
                 assert self._joints[self.dof_names_ordered[idx]].driven, "Controllers should only control driveable joints!"
             self._controllers[name] = controller
+
+        # Cache the action / joint index mappings and action dimension, since these are fixed for a given set of
+        # controllers and are otherwise queried every step
+        self._controller_action_idx = dict()
+        self._controller_joint_idx = dict()
+        idx = 0
+        for name in self.controller_order:
+            controller = self._controllers[name]
+            self._controller_action_idx[name] = np.arange(idx, idx + controller.command_dim)
+            self._controller_joint_idx[name] = controller.dof_idx
+            idx += controller.command_dim
+        self._action_dim = idx
+
         self.update_controller_mode()
 
     def update_controller_mode(self):
@@ -297,7 +313,7 @@ class ControllableObject(BaseObject):
 
         # If we're using discrete action space, we grab the specific action and use that to convert to control
         if self._action_type == "discrete":
-            action = np.array(self.discrete_action_list[action])
+            action = np.asarray(self.discrete_action_list[action])
 
         # Check if the input action's length matches the action dimension
         assert len(action) == self.action_dim, "Action must be dimension {}, got dim {} instead.".format(
@@ -344,7 +360,7 @@ class ControllableObject(BaseObject):
         # Compose controls
         u_vec = np.zeros(self.n_dof)
         # By default, the control type is None and the control value is 0 (np.zeros) - i.e. no control applied
-        u_type_vec = np.array([ControlType.NONE] * self.n_dof)
+        u_type_vec = np.full(self.n_dof, ControlType.NONE)
         for group, ctrl in control.items():
             idx = self._controllers[group].dof_idx
             u_vec[idx] = ctrl["value"]
@@ -535,7 +551,7 @@ class ControllableObject(BaseObject):
             int: Dimension of action space for this object. By default,
                 is the sum over all controller action dimensions
         """
-        return sum([controller.command_dim for controller in self._controllers.values()])
+        return self._action_dim
 
     @property
     def action_space(self):
@@ -585,14 +601,7 @@ class ControllableObject(BaseObject):
             dict: Mapping from controller names (e.g.: head, base, arm, etc.) to corresponding
                 indices (list) in the action vector
         """
-        dic = {}
-        idx = 0
-        for controller in self.controller_order:
-            cmd_dim = self._controllers[controller].command_dim
-            dic[controller] = np.arange(idx, idx + cmd_dim)
-            idx += cmd_dim
-
-        return dic
+        return self._controller_action_idx
 
     @property
     def controller_joint_idx(self):
@@ -601,11 +610,7 @@ class ControllableObject(BaseObject):
             dict: Mapping from controller names (e.g.: head, base, arm, etc.) to corresponding
                 indices (list) of the joint state vector controlled by each controller
         """
-        dic = {}
-        for controller in self.controller_order:
-            dic[controller] = self._controllers[controller].dof_idx
-
-        return dic
+        return self._controller_joint_idx
 
     @property
     def control_limits(self):
@@ -387,9 +387,12 @@ class StatefulObject(BaseObject):
         if len(self._visual_states) > 0:
             texture_change_states = []
             emitter_enabled = defaultdict(bool)
+            all_texture_change_states = get_texture_change_states()
+            steam_states = get_steam_states()
+            fire_states = get_fire_states()
             for state_type in self._visual_states:
                 state = self.states[state_type]
-                if state_type in get_texture_change_states():
+                if state_type in all_texture_change_states:
                     if state_type == Saturated:
                         for particle_system in ParticleRemover.supported_active_systems:
                             if state.get_value(particle_system):
@@ -398,15 +401,17 @@ class StatefulObject(BaseObject):
                                 break
                     elif state.get_value():
                         texture_change_states.append(state)
-                if state_type in get_steam_states():
+                if state_type in steam_states:
                     emitter_enabled[EmitterType.STEAM] |= state.get_value()
-                if state_type in get_fire_states():
+                if state_type in fire_states:
                     emitter_enabled[EmitterType.FIRE] |= state.get_value()
 
-                for emitter_type in emitter_enabled:
-                    self.set_emitter_enabled(emitter_type, emitter_enabled[emitter_type])
+            # Only toggle the emitters once all visual states have been aggregated
+            for emitter_type, enabled in emitter_enabled.items():
+                self.set_emitter_enabled(emitter_type, enabled)
 
-            texture_change_states.sort(key=lambda s: get_texture_change_priority()[s.__class__])
+            texture_change_priority = get_texture_change_priority()
+            texture_change_states.sort(key=lambda s: texture_change_priority[s.__class__])
             object_state = texture_change_states[-1] if len(texture_change_states) > 0 else None
 
             # Only update our texture change if it's a different object state than the one we already have
@@ -481,7 +486,14 @@ class StatefulObject(BaseObject):
         return state
 
     def _load_state(self, state):
-        # Call super method first
+        # Check whether loading this state moves this object if it's fixed, since then any cached static collision
+        # geometry in the scene becomes stale
+        if self.fixed_base and og.sim.scene is not None:
+            pos, ori = self.get_position_orientation()
+            if not (np.allclose(pos, state["root_link"]["pos"]) and np.allclose(ori, state["root_link"]["ori"])):
+                og.sim.scene.clear_static_collision_aabbs(obj=self)
+
+        # Call super method
         super()._load_state(state=state)
 
         # Load all states that are stateful
@@ -538,6 +550,10 @@ class StatefulObject(BaseObject):
         super().set_position_orientation(position=position, orientation=orientation)
         self.clear_states_cache()
 
+        # Moving a fixed object invalidates any cached static collision geometry in the scene
+        if self.fixed_base and og.sim.scene is not None:
+            og.sim.scene.clear_static_collision_aabbs(obj=self)
+
     @classproperty
     def _do_not_register_classes(cls):
         # Don't register this class since it's an abstract template
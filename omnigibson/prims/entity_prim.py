@@ -40,6 +40,8 @@ class EntityPrim(XFormPrim):
 
             visual_only (None or bool): If specified, whether this prim should include collisions or not.
                     Default is True.
+            disabled_collision_link_names (None or list of str): If specified, names of additional links (on top of
+                    self.disabled_collision_link_names) whose collisions should be globally disabled at load time.
         """
 
     def __init__(
@@ -138,8 +140,11 @@ class EntityPrim(XFormPrim):
             if gm.AG_CLOTH:
                 self.create_attachment_point_link()
 
-        # Globally disable any requested collision links
-        for link_name in self.disabled_collision_link_names:
+        # Globally disable any requested collision links, including any additionally specified from the load config
+        disabled_collision_link_names = set(self.disabled_collision_link_names)
+        if self._load_config.get("disabled_collision_link_names", None) is not None:
+            disabled_collision_link_names.update(self._load_config["disabled_collision_link_names"])
+        for link_name in disabled_collision_link_names:
             self._links[link_name].disable_collisions()
 
         # Disable any requested collision pairs
@@ -1301,8 +1306,13 @@ class EntityPrim(XFormPrim):
         """
         self.set_linear_velocity(velocity=np.zeros(3))
         self.set_angular_velocity(velocity=np.zeros(3))
-        for joint in self._joints.values():
-            joint.keep_still()
+        if self._handle is not None and self._n_dof > 0:
+            # Zero out all DOF velocities (and velocity targets) in a single batched articulation call, rather than
+            # two per-DOF calls for every joint
+            self.set_joint_velocities(velocities=np.zeros(self._n_dof))
+        else:
+            for joint in self._joints.values():
+                joint.keep_still()
         # Make sure object is awake
         self.wake()
 
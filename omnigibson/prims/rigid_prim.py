@@ -182,7 +182,7 @@ class RigidPrim(XFormPrim):
                     vols.append(volume)
                     # We need to translate the center of mass from the mesh's local frame to the link's local frame
                     local_pos, local_orn = mesh.get_local_pose()
-                    coms.append(T.quat2mat(local_orn) @ (com * mesh.scale) + local_pos)
+                    coms.append(T.quat_apply(local_orn, com * mesh.scale) + local_pos)
                     # If we're not a valid volume, use bounding box approximation for the underlying collision approx
                     if not is_volume:
                         log.warning(f"Got invalid (non-volume) collision mesh: {mesh.name}")
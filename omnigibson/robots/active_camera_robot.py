@@ -37,10 +37,12 @@ class ActiveCameraRobot(BaseRobot):
         # Add camera pos info
         joint_positions = self.get_joint_positions(normalized=False)
         joint_velocities = self.get_joint_velocities(normalized=False)
-        dic["camera_qpos"] = joint_positions[self.camera_control_idx]
-        dic["camera_qpos_sin"] = np.sin(joint_positions[self.camera_control_idx])
-        dic["camera_qpos_cos"] = np.cos(joint_positions[self.camera_control_idx])
-        dic["camera_qvel"] = joint_velocities[self.camera_control_idx]
+        camera_idx = self.camera_control_idx
+        camera_qpos = joint_positions[camera_idx]
+        dic["camera_qpos"] = camera_qpos
+        dic["camera_qpos_sin"] = np.sin(camera_qpos)
+        dic["camera_qpos_cos"] = np.cos(camera_qpos)
+        dic["camera_qvel"] = joint_velocities[camera_idx]
 
         return dic
 
@@ -22,6 +22,15 @@ RESET_JOINT_OPTIONS = {
     "untuck",
 }
 
+# Untucked arm joint configurations, keyed by default arm pose
+UNTUCKED_ARM_JOINT_POS = {
+    "vertical": np.array([-0.94121, -0.64134, 1.55186, 1.65672, -0.93218, 1.53416, 2.14474]),
+    "diagonal15": np.array([-0.95587, -0.34778, 1.46388, 1.47821, -0.93813, 1.4587, 1.9939]),
+    "diagonal30": np.array([-1.06595, -0.22184, 1.53448, 1.46076, -0.84995, 1.36904, 1.90996]),
+    "diagonal45": np.array([-1.11479, -0.0685, 1.5696, 1.37304, -0.74273, 1.3983, 1.79618]),
+    "horizontal": np.array([-1.43016, 0.20965, 1.86816, 1.77576, -0.27289, 1.31715, 2.01226]),
+}
+
 
 class Fetch(ManipulationRobot, TwoWheelRobot, ActiveCameraRobot):
     """
@@ -120,6 +129,10 @@ class Fetch(ManipulationRobot, TwoWheelRobot, ActiveCameraRobot):
         assert_valid_key(key=default_arm_pose, valid_keys=DEFAULT_ARM_POSES, name="default_arm_pose")
         self.default_arm_pose = default_arm_pose
 
+        # Other args that will be created at runtime
+        self._untucked_default_joint_pos = None
+        self._untucked_default_joint_pos_key = None
+
         # Parse reset joint pos if specifying special string
         if isinstance(reset_joint_pos, str):
             assert (
@@ -180,36 +193,28 @@ class Fetch(ManipulationRobot, TwoWheelRobot, ActiveCameraRobot):
 
     @property
     def untucked_default_joint_pos(self):
-        pos = np.zeros(self.n_joints)
-        pos[self.base_control_idx] = 0.0
-        pos[self.trunk_control_idx] = 0.02 + self.default_trunk_offset
-        pos[self.camera_control_idx] = np.array([0.0, 0.45])
-        pos[self.gripper_control_idx[self.default_arm]] = np.array([0.05, 0.05])  # open gripper
-
-        # Choose arm based on setting
-        if self.default_arm_pose == "vertical":
-            pos[self.arm_control_idx[self.default_arm]] = np.array(
-                [-0.94121, -0.64134, 1.55186, 1.65672, -0.93218, 1.53416, 2.14474]
-            )
-        elif self.default_arm_pose == "diagonal15":
-            pos[self.arm_control_idx[self.default_arm]] = np.array(
-                [-0.95587, -0.34778, 1.46388, 1.47821, -0.93813, 1.4587, 1.9939]
-            )
-        elif self.default_arm_pose == "diagonal30":
-            pos[self.arm_control_idx[self.default_arm]] = np.array(
-                [-1.06595, -0.22184, 1.53448, 1.46076, -0.84995, 1.36904, 1.90996]
-            )
-        elif self.default_arm_pose == "diagonal45":
-            pos[self.arm_control_idx[self.default_arm]] = np.array(
-                [-1.11479, -0.0685, 1.5696, 1.37304, -0.74273, 1.3983, 1.79618]
-            )
-        elif self.default_arm_pose == "horizontal":
-            pos[self.arm_control_idx[self.default_arm]] = np.array(
-                [-1.43016, 0.20965, 1.86816, 1.77576, -0.27289, 1.31715, 2.01226]
-            )
-        else:
-            raise ValueError("Unknown default arm pose: {}".format(self.default_arm_pose))
-        return pos
+        return self._get_untucked_default_joint_pos().copy()
+
+    def _get_untucked_default_joint_pos(self):
+        """
+        Returns:
+            n-array: Cached untucked joint configuration. Since its values only depend on the default arm pose and
+                trunk offset, it is only recomputed whenever those change. Note that this is the internal array and
+                should NOT be modified in-place
+        """
+        key = (self.default_arm, self.default_arm_pose, self.default_trunk_offset)
+        if self._untucked_default_joint_pos is None or self._untucked_default_joint_pos_key != key:
+            if self.default_arm_pose not in UNTUCKED_ARM_JOINT_POS:
+                raise ValueError("Unknown default arm pose: {}".format(self.default_arm_pose))
+            pos = np.zeros(self.n_joints)
+            pos[self.base_control_idx] = 0.0
+            pos[self.trunk_control_idx] = 0.02 + self.default_trunk_offset
+            pos[self.camera_control_idx] = np.array([0.0, 0.45])
+            pos[self.gripper_control_idx[self.default_arm]] = np.array([0.05, 0.05])  # open gripper
+            pos[self.arm_control_idx[self.default_arm]] = UNTUCKED_ARM_JOINT_POS[self.default_arm_pose]
+            self._untucked_default_joint_pos = pos
+            self._untucked_default_joint_pos_key = key
+        return self._untucked_default_joint_pos
 
     @property
     def discrete_action_list(self):
@@ -248,8 +253,9 @@ class Fetch(ManipulationRobot, TwoWheelRobot, ActiveCameraRobot):
 
         # Override trunk value if we're keeping the trunk rigid
         if self.rigid_trunk:
-            u_vec[self.trunk_control_idx] = self.untucked_default_joint_pos[self.trunk_control_idx]
-            u_type_vec[self.trunk_control_idx] = ControlType.POSITION
+            trunk_idx = self.trunk_control_idx
+            u_vec[trunk_idx] = self._get_untucked_default_joint_pos()[trunk_idx]
+            u_type_vec[trunk_idx] = ControlType.POSITION
 
         # Return control
         return u_vec, u_type_vec
@@ -260,8 +266,9 @@ class Fetch(ManipulationRobot, TwoWheelRobot, ActiveCameraRobot):
         # Add trunk info
         joint_positions = self.get_joint_positions(normalized=False)
         joint_velocities = self.get_joint_velocities(normalized=False)
-        dic["trunk_qpos"] = joint_positions[self.trunk_control_idx]
-        dic["trunk_qvel"] = joint_velocities[self.trunk_control_idx]
+        trunk_idx = self.trunk_control_idx
+        dic["trunk_qpos"] = joint_positions[trunk_idx]
+        dic["trunk_qvel"] = joint_velocities[trunk_idx]
 
         return dic
 
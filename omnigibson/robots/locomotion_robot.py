@@ -43,10 +43,12 @@ class LocomotionRobot(BaseRobot):
         joint_velocities = self.get_joint_velocities(normalized=False)
 
         # Add base info
-        dic["base_qpos"] = joint_positions[self.base_control_idx]
-        dic["base_qpos_sin"] = np.sin(joint_positions[self.base_control_idx])
-        dic["base_qpos_cos"] = np.cos(joint_positions[self.base_control_idx])
-        dic["base_qvel"] = joint_velocities[self.base_control_idx]
+        base_idx = self.base_control_idx
+        base_qpos = joint_positions[base_idx]
+        dic["base_qpos"] = base_qpos
+        dic["base_qpos_sin"] = np.sin(base_qpos)
+        dic["base_qpos_cos"] = np.cos(base_qpos)
+        dic["base_qvel"] = joint_velocities[base_idx]
 
         return dic
 
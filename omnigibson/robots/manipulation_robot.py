@@ -258,8 +258,7 @@ class ManipulationRobot(BaseRobot):
             is_grasping = self._controllers["gripper_{}".format(arm)].is_grasping()
             # If candidate obj is not None, we also check to see if our fingers are in contact with the object
             if is_grasping and candidate_obj is not None:
-                finger_links = {link for link in self.finger_links[arm]}
-                is_grasping = len(candidate_obj.states[ContactBodies].get_value().intersection(finger_links)) > 0
+                is_grasping = not candidate_obj.states[ContactBodies].get_value().isdisjoint(self.finger_links[arm])
 
         return is_grasping
 
@@ -292,11 +291,12 @@ class ManipulationRobot(BaseRobot):
         link_paths = set(self.link_prim_paths)
 
         for con_res in con_results:
-            # Only add this contact if it's not a robot self-collision
-            other_contact_set = {con_res.body0, con_res.body1} - link_paths
-            if len(other_contact_set) == 1:
-                link_contact, other_contact = (con_res.body0, con_res.body1) if \
-                    list(other_contact_set)[0] == con_res.body1 else (con_res.body1, con_res.body0)
+            # Only add this contact if it's not a robot self-collision, i.e.: exactly one body belongs to the robot.
+            # We check membership directly instead of building a temporary set per contact
+            body0, body1 = con_res.body0, con_res.body1
+            body0_is_robot, body1_is_robot = body0 in link_paths, body1 in link_paths
+            if body0_is_robot != body1_is_robot:
+                link_contact, other_contact = (body0, body1) if body0_is_robot else (body1, body0)
                 # Add to contact data
                 contact_data.add((other_contact, tuple(con_res.position)) if return_contact_positions else other_contact)
                 # Also add robot contact link info
@@ -397,12 +397,15 @@ class ManipulationRobot(BaseRobot):
         # Loop over all arms to grab proprio info
         joint_positions = self.get_joint_positions(normalized=False)
         joint_velocities = self.get_joint_velocities(normalized=False)
+        arm_control_idx = self.arm_control_idx
+        gripper_control_idx = self.gripper_control_idx
         for arm in self.arm_names:
             # Add arm info
-            dic["arm_{}_qpos".format(arm)] = joint_positions[self.arm_control_idx[arm]]
-            dic["arm_{}_qpos_sin".format(arm)] = np.sin(joint_positions[self.arm_control_idx[arm]])
-            dic["arm_{}_qpos_cos".format(arm)] = np.cos(joint_positions[self.arm_control_idx[arm]])
-            dic["arm_{}_qvel".format(arm)] = joint_velocities[self.arm_control_idx[arm]]
+            arm_qpos = joint_positions[arm_control_idx[arm]]
+            dic["arm_{}_qpos".format(arm)] = arm_qpos
+            dic["arm_{}_qpos_sin".format(arm)] = np.sin(arm_qpos)
+            dic["arm_{}_qpos_cos".format(arm)] = np.cos(arm_qpos)
+            dic["arm_{}_qvel".format(arm)] = joint_velocities[arm_control_idx[arm]]
 
             # Add eef and grasping info
             dic["eef_{}_pos_global".format(arm)] = self.get_eef_position(arm)
@@ -410,8 +413,8 @@ class ManipulationRobot(BaseRobot):
             dic["eef_{}_pos".format(arm)] = self.get_relative_eef_position(arm)
             dic["eef_{}_quat".format(arm)] = self.get_relative_eef_orientation(arm)
             dic["grasp_{}".format(arm)] = np.array([self.is_grasping(arm)])
-            dic["gripper_{}_qpos".format(arm)] = joint_positions[self.gripper_control_idx[arm]]
-            dic["gripper_{}_qvel".format(arm)] = joint_velocities[self.gripper_control_idx[arm]]
+            dic["gripper_{}_qpos".format(arm)] = joint_positions[gripper_control_idx[arm]]
+            dic["gripper_{}_qvel".format(arm)] = joint_velocities[gripper_control_idx[arm]]
 
         return dic
 
@@ -740,11 +743,11 @@ class ManipulationRobot(BaseRobot):
             rb_handle = self._dc.get_rigid_body(prim_path)
             pose = self._dc.get_rigid_body_pose(rb_handle)
             link_pos = np.asarray(pose.p)
-            dist = np.linalg.norm(np.array(link_pos) - np.array(gripper_center_pos))
+            dist = T.l2_distance(link_pos, gripper_center_pos)
             candidate_data.append((prim_path, dist))
 
-        candidate_data = sorted(candidate_data, key=lambda x: x[-1])
-        ag_prim_path, _ = candidate_data[0]
+        # We only need the closest candidate, so no need to sort all of them
+        ag_prim_path, _ = min(candidate_data, key=lambda x: x[-1])
 
         # Make sure the ag_prim_path is not a self collision
         assert ag_prim_path not in self.link_prim_paths, "assisted grasp object cannot be the robot itself!"
@@ -1069,8 +1072,9 @@ class ManipulationRobot(BaseRobot):
 
             # TODO: Why are we separately checking for complementary conditions?
             threshold = np.mean(self._controllers[f"gripper_{arm}"].command_input_limits)
-            applying_grasp = action[self.controller_action_idx[f"gripper_{arm}"][0]] < threshold
-            releasing_grasp = action[self.controller_action_idx[f"gripper_{arm}"][0]] > threshold
+            gripper_action = action[self._controller_action_idx[f"gripper_{arm}"][0]]
+            applying_grasp = gripper_action < threshold
+            releasing_grasp = gripper_action > threshold
 
             # Execute gradual release of object
             if self._ag_obj_in_hand[arm]:
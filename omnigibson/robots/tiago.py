@@ -31,6 +31,19 @@ RESET_JOINT_OPTIONS = {
     "untuck",
 }
 
+# Constant (non-base) joint configurations used for tucking / untucking the robot
+TUCKED_ARM_JOINT_POS = np.array([-1.10, 1.47, 2.71, 1.71, -1.57, 1.39, 0])
+UNTUCKED_ARM_JOINT_POS = {
+    "vertical": np.array([0.22, 0.48, 1.52, 1.76, 0.04, -0.49, 0]),
+    "diagonal15": np.array([0.22, 0.48, 1.52, 1.76, 0.04, -0.49, 0]),
+    "diagonal30": np.array([0.22, 0.48, 1.52, 1.76, 0.04, -0.49, 0]),
+    "diagonal45": np.array([0.22, 0.48, 1.52, 1.76, 0.04, -0.49, 0]),
+    "horizontal": np.array([0.22, 0.48, 1.52, 1.76, 0.04, -0.49, 0]),
+}
+OPEN_GRIPPER_JOINT_POS = np.array([0.045, 0.045])
+TUCKED_CAMERA_JOINT_POS = np.array([0.0, 0.0])
+UNTUCKED_CAMERA_JOINT_POS = np.array([0.0, 0.45])
+
 m.MAX_LINEAR_VELOCITY = 1.5  # linear velocity in meters/second
 m.MAX_ANGULAR_VELOCITY = np.pi  # angular velocity in radians/second
 
@@ -139,6 +152,9 @@ class Tiago(ManipulationRobot, LocomotionRobot, ActiveCameraRobot):
 
         # Other args that will be created at runtime
         self._world_base_fixed_joint_prim = None
+        self._tucked_default_joint_pos = None
+        self._untucked_default_joint_pos = None
+        self._untucked_default_joint_pos_key = None
 
         # Parse reset joint pos if specifying special string
         if isinstance(reset_joint_pos, str):
@@ -196,50 +212,40 @@ class Tiago(ManipulationRobot, LocomotionRobot, ActiveCameraRobot):
 
     @property
     def tucked_default_joint_pos(self):
-        pos = np.zeros(self.n_dof)
+        # All non-base joint values are constant, so we only compute them once and re-use them afterwards
+        if self._tucked_default_joint_pos is None:
+            pos = np.zeros(self.n_dof)
+            pos[self.trunk_control_idx] = 0
+            pos[self.camera_control_idx] = TUCKED_CAMERA_JOINT_POS
+            for arm in self.arm_names:
+                pos[self.gripper_control_idx[arm]] = OPEN_GRIPPER_JOINT_POS
+                pos[self.arm_control_idx[arm]] = TUCKED_ARM_JOINT_POS
+            self._tucked_default_joint_pos = pos
+
+        pos = self._tucked_default_joint_pos.copy()
         # Keep the current joint positions for the base joints
         pos[self.base_idx] = self.get_joint_positions()[self.base_idx]
-        pos[self.trunk_control_idx] = 0
-        pos[self.camera_control_idx] = np.array([0.0, 0.0])
-        for arm in self.arm_names:
-            pos[self.gripper_control_idx[arm]] = np.array([0.045, 0.045])  # open gripper
-            pos[self.arm_control_idx[arm]] = np.array(
-                [-1.10, 1.47, 2.71, 1.71, -1.57, 1.39, 0]
-            )
         return pos
 
     @property
     def untucked_default_joint_pos(self):
-        pos = np.zeros(self.n_dof)
+        # All non-base joint values only depend on the default arm pose and trunk offset, so we only recompute them
+        # whenever those change
+        key = (self.default_arm, self.default_arm_pose, self.default_trunk_offset)
+        if self._untucked_default_joint_pos is None or self._untucked_default_joint_pos_key != key:
+            if self.default_arm_pose not in UNTUCKED_ARM_JOINT_POS:
+                raise ValueError("Unknown default arm pose: {}".format(self.default_arm_pose))
+            pos = np.zeros(self.n_dof)
+            pos[self.trunk_control_idx] = 0.02 + self.default_trunk_offset
+            pos[self.camera_control_idx] = UNTUCKED_CAMERA_JOINT_POS
+            pos[self.gripper_control_idx[self.default_arm]] = OPEN_GRIPPER_JOINT_POS
+            pos[self.arm_control_idx[self.default_arm]] = UNTUCKED_ARM_JOINT_POS[self.default_arm_pose]
+            self._untucked_default_joint_pos = pos
+            self._untucked_default_joint_pos_key = key
+
+        pos = self._untucked_default_joint_pos.copy()
         # Keep the current joint positions for the base joints
         pos[self.base_idx] = self.get_joint_positions()[self.base_idx]
-        pos[self.trunk_control_idx] = 0.02 + self.default_trunk_offset
-        pos[self.camera_control_idx] = np.array([0.0, 0.45])
-        pos[self.gripper_control_idx[self.default_arm]] = np.array([0.045, 0.045])  # open gripper
-
-        # Choose arm based on setting
-        if self.default_arm_pose == "vertical":
-            pos[self.arm_control_idx[self.default_arm]] = np.array(
-                [0.22, 0.48, 1.52, 1.76, 0.04, -0.49, 0]
-            )
-        elif self.default_arm_pose == "diagonal15":
-            pos[self.arm_control_idx[self.default_arm]] = np.array(
-                [0.22, 0.48, 1.52, 1.76, 0.04, -0.49, 0]
-            )
-        elif self.default_arm_pose == "diagonal30":
-            pos[self.arm_control_idx[self.default_arm]] = np.array(
-                [0.22, 0.48, 1.52, 1.76, 0.04, -0.49, 0]
-            )
-        elif self.default_arm_pose == "diagonal45":
-            pos[self.arm_control_idx[self.default_arm]] = np.array(
-                [0.22, 0.48, 1.52, 1.76, 0.04, -0.49, 0]
-            )
-        elif self.default_arm_pose == "horizontal":
-            pos[self.arm_control_idx[self.default_arm]] = np.array(
-                [0.22, 0.48, 1.52, 1.76, 0.04, -0.49, 0]
-            )
-        else:
-            raise ValueError("Unknown default arm pose: {}".format(self.default_arm_pose))
         return pos
 
     def _create_discrete_action_space(self):
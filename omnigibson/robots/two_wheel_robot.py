@@ -1,5 +1,6 @@
 from abc import abstractmethod
 import gym
+import numpy as np
 
 from omnigibson.robots.locomotion_robot import LocomotionRobot
 from omnigibson.utils.python_utils import classproperty
@@ -20,6 +21,13 @@ class TwoWheelRobot(LocomotionRobot):
                 values specified, but setting these individual kwargs will override them
     """
 
+    def __init__(self, *args, **kwargs):
+        # Discrete action table, which is only created if this robot uses a discrete action space
+        self._discrete_action_list = None
+
+        # Run super init
+        super().__init__(*args, **kwargs)
+
     def _validate_configuration(self):
         # Make sure base only has two indices (i.e.: two wheels for differential drive)
         assert len(self.base_control_idx) == 2, "Differential drive can only be used with robot with two base joints!"
@@ -56,10 +64,19 @@ class TwoWheelRobot(LocomotionRobot):
                 [0, 0],
             ]
 
-        self.action_list = action_list
+        # Freeze the action list into a read-only (n_actions, 2) table, so that each discrete action can be looked up
+        # as a row view without any per-step list-to-array conversion
+        self._discrete_action_list = np.array(action_list, dtype=float)
+        self._discrete_action_list.flags.writeable = False
 
         # Return this action space
-        return gym.spaces.Discrete(n=len(self.action_list))
+        return gym.spaces.Discrete(n=len(self._discrete_action_list))
+
+    @property
+    def discrete_action_list(self):
+        if self._discrete_action_list is None:
+            raise ValueError(f"Robot {self.name} does not use a discrete action space, so it has no discrete action list!")
+        return self._discrete_action_list
 
     def _get_proprioception_dict(self):
         dic = super()._get_proprioception_dict()
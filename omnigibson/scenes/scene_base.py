@@ -52,6 +52,7 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
         """
         # Store internal variables
         self.scene_file = scene_file
+        self._scene_file_info = None                    # Parsed contents of @scene_file, lazily loaded on first access
         self._loaded = False                    # Whether this scene exists in the stage or not
         self._initialized = False               # Whether this scene has its internal handles / info initialized or not (occurs AFTER and INDEPENDENTLY from loading!)
         self._registry = None
@@ -64,6 +65,8 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
         self._floor_plane = None
         self._use_skybox = use_skybox
         self._skybox = None
+        self._static_collision_aabbs = None            # Cached AABBs of all static collision geometry in this scene
+        self._static_collision_obj_names = None        # Names of the objects included in the cached static AABBs
 
         # Call super init
         super().__init__()
@@ -92,6 +95,90 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
         """
         return self._floor_plane
 
+    @property
+    def static_collision_objects(self):
+        """
+        Returns:
+            list of BaseObject: All fixed-base, non-articulated, non-visual-only, non-robot objects in this scene.
+                Fixed-base objects with any non-fixed joints (e.g.: cabinets, fridges) are NOT included, since their
+                links can still move through their joints
+        """
+        return [obj for obj in self.fixed_objects.values() if not obj.visual_only and obj.n_joints == 0]
+
+    @property
+    def static_collision_aabbs(self):
+        """
+        AABBs of all static collision geometry in this scene. This consists of one box per collision mesh of all
+        @static_collision_objects (so that objects made up of many meshes, e.g.: walls or floors, are not represented
+        by a single box spanning the whole room), as well as any additional scene-level geometry (e.g.: the floor
+        plane). Articulated fixed-base objects are excluded and should be treated as dynamic obstacles instead.
+
+        These are cached once computed. The cache is cleared whenever an object is added to or removed from this
+        scene, and whenever a fixed-base object is moved (via set_position_orientation() or load_state()).
+
+        Returns:
+            2-tuple:
+                - (M, 3)-array: (x,y,z) lower corners of the static bounding boxes
+                - (M, 3)-array: (x,y,z) upper corners of the static bounding boxes
+        """
+        if self._static_collision_aabbs is None:
+            objs = self.static_collision_objects
+            lowers, uppers = self._compute_static_collision_aabbs(objs=objs)
+            self._static_collision_aabbs = (np.array(lowers).reshape(-1, 3), np.array(uppers).reshape(-1, 3))
+            self._static_collision_obj_names = {obj.name for obj in objs}
+        return self._static_collision_aabbs
+
+    @property
+    def coarse_collision_check_supported(self):
+        """
+        Returns:
+            bool: Whether @static_collision_aabbs tightly cover all static collision geometry in this scene, so that
+                they can be used to coarsely rule out collisions. Should be overridden by subclasses with static
+                geometry that cannot be usefully represented by AABBs (e.g.: a single mesh for a whole building)
+        """
+        return True
+
+    def _compute_static_collision_aabbs(self, objs):
+        """
+        Computes the AABBs of all static collision geometry in this scene. Should be extended by subclasses that own
+        additional static geometry that is not tracked as an object.
+
+        Args:
+            objs (list of BaseObject): Static objects whose collision meshes should be included
+
+        Returns:
+            2-tuple:
+                - list of 3-array: (x,y,z) lower corners of the static bounding boxes
+                - list of 3-array: (x,y,z) upper corners of the static bounding boxes
+        """
+        lowers, uppers = [], []
+        for obj in objs:
+            for link in obj.links.values():
+                for mesh in link.collision_meshes.values():
+                    lower, upper = mesh.aabb
+                    lowers.append(lower)
+                    uppers.append(upper)
+
+        # The floor plane is infinite, so we represent it as the half-space below its height
+        if self._floor_plane is not None:
+            lowers.append(np.full(3, -np.inf))
+            uppers.append(np.array([np.inf, np.inf, self._floor_plane.get_position()[2]]))
+
+        return lowers, uppers
+
+    def clear_static_collision_aabbs(self, obj=None):
+        """
+        Clears the cached static collision AABBs, so that they are recomputed on next access. This should be called
+        whenever any static geometry is moved.
+
+        Args:
+            obj (None or BaseObject): If specified, the object that was moved. The cache will then only be cleared if
+                it includes @obj
+        """
+        if obj is None or (self._static_collision_obj_names is not None and obj.name in self._static_collision_obj_names):
+            self._static_collision_aabbs = None
+            self._static_collision_obj_names = None
+
     @property
     def object_registry(self):
         """
@@ -192,8 +279,7 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
         (information stored in the world prim's CustomData)
         """
         # Grab objects info from the scene file
-        with open(self.scene_file, "r") as f:
-            scene_info = json.load(f)
+        scene_info = self._get_scene_file_info()
         init_info = scene_info["objects_info"]["init_info"]
         init_state = scene_info["state"]["object_registry"]
         init_systems = scene_info["state"]["system_registry"].keys()
@@ -222,8 +308,7 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
         """
         Loads metadata from self.scene_file and stores it within the world prim's CustomData
         """
-        with open(self.scene_file, "r") as f:
-            scene_info = json.load(f)
+        scene_info = self._get_scene_file_info()
 
         # Write the metadata
         for key, data in scene_info.get("metadata", dict()).items():
@@ -308,13 +393,25 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
         if self.scene_file is None:
             init_state = self.dump_state(serialized=False)
         else:
-            with open(self.scene_file, "r") as f:
-                scene_info = json.load(f)
-            init_state = scene_info["state"]
+            init_state = self._get_scene_file_info()["state"]
             og.sim.load_state(init_state, serialized=False)
 
         self._initial_state = init_state
 
+        # The scene file contents are no longer needed, so free them
+        self._scene_file_info = None
+
+    def _get_scene_file_info(self):
+        """
+        Returns:
+            dict: Parsed contents of @self.scene_file. This is loaded on first access and cached afterwards, so that the
+                (potentially large) json file is only read and parsed once while loading and initializing this scene
+        """
+        if self._scene_file_info is None:
+            with open(self.scene_file, "r") as f:
+                self._scene_file_info = json.load(f)
+        return self._scene_file_info
+
     def _create_registry(self):
         """
         Creates the internal registry used for tracking all objects
@@ -442,6 +539,9 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
             # Run any additional scene-specific logic with the created object
             self._add_object(obj)
 
+            # The set of static geometry may have changed
+            self.clear_static_collision_aabbs()
+
         return prim
 
     def remove_object(self, obj):
@@ -454,6 +554,9 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
         # Remove from the appropriate registry
         self.object_registry.remove(obj)
 
+        # The set of static geometry may have changed
+        self.clear_static_collision_aabbs()
+
         # Remove from omni stage
         obj.remove()
 
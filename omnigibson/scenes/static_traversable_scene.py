@@ -113,6 +113,14 @@ class StaticTraversableScene(TraversableScene):
         height = height if height is not None else self.floor_heights[floor] + additional_elevation
         self._floor_plane.set_position(np.array([0, 0, height]))
 
+        # The floor plane is static geometry, so the cached static AABBs are now stale
+        self.clear_static_collision_aabbs()
+
+    @property
+    def coarse_collision_check_supported(self):
+        # The scene mesh is a single mesh for the whole building, whose AABB contains every traversable pose
+        return False
+
     def get_floor_height(self, floor=0):
         """
         Return the current floor height (in meter)
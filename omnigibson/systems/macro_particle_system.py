@@ -493,7 +493,8 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
         link_prim_paths = [None] * n_particles if is_cloth else link_prim_paths
 
         scales = cls.sample_scales_by_group(group=group, n=n_particles) if scales is None else scales
-        bbox_extents_local = [(cls._particle_object.aabb_extent * scale).tolist() for scale in scales]
+        # Query the template's extent once and scale all particles in a single vectorized op
+        bbox_extents_local = (cls._particle_object.aabb_extent * np.asarray(scales)).tolist()
 
         # If we're using flatcache, we need to update the object's pose on the USD manually
         if gm.ENABLE_FLATCACHE:
@@ -1187,7 +1188,7 @@ class MacroPhysicalParticleSystem(PhysicalParticleSystem, MacroParticleSystem):
         if cls.n_particles > 0:
             tfs = cls.particles_view.get_transforms()
             pos, ori = tfs[:, :3], tfs[:, 3:]
-            pos = pos + T.quat2mat(ori) @ cls._particle_offset
+            pos = pos + T.quat_apply(ori, cls._particle_offset)
         else:
             pos, ori = np.array([]).reshape(0, 3), np.array([]).reshape(0, 4)
         return pos, ori
@@ -1216,7 +1217,7 @@ class MacroPhysicalParticleSystem(PhysicalParticleSystem, MacroParticleSystem):
         if positions is None or orientations is None:
             pos, ori = cls.get_particles_position_orientation()
             orientations = ori if orientations is None else orientations
-            positions = pos if positions is None else (positions - T.quat2mat(orientations) @ cls._particle_offset)
+            positions = pos if positions is None else (positions - T.quat_apply(orientations, cls._particle_offset))
         cls.particles_view.set_transforms(np.concatenate([positions, orientations], axis=1), indices=np.arange(len(positions)))
 
     @classmethod
@@ -1230,7 +1231,7 @@ class MacroPhysicalParticleSystem(PhysicalParticleSystem, MacroParticleSystem):
         if position is None or orientation is None:
             pos, ori = cls.get_particle_position_orientation(idx=idx)
             orientation = ori if orientation is None else orientation
-            position = pos if position is None else (position - T.quat2mat(orientation) @ cls._particle_offset)
+            position = pos if position is None else (position - T.quat_apply(orientation, cls._particle_offset))
         cls.particles_view.set_transforms(np.concatenate([position, orientation]).reshape(1, -1), indices=np.array([idx]))
 
     @classmethod
@@ -359,8 +359,10 @@ class BehaviorTask(BaseTask):
         low_dim_obs = dict()
 
         # Batch rpy calculations for much better efficiency
+        # Grab each existing object's pose only once, since both its position and orientation are needed below
         objs_exist = {obj: obj.exists for obj in self.object_scope.values() if not obj.is_system}
-        objs_rpy = T.quat2euler(np.array([obj.states[Pose].get_value()[1] if obj_exist else np.array([0, 0, 0, 1.0])
+        objs_pose = {obj: obj.states[Pose].get_value() for obj, obj_exist in objs_exist.items() if obj_exist}
+        objs_rpy = T.quat2euler(np.array([objs_pose[obj][1] if obj_exist else np.array([0, 0, 0, 1.0])
                                           for obj, obj_exist in objs_exist.items()]))
         objs_rpy_cos = np.cos(objs_rpy)
         objs_rpy_sin = np.sin(objs_rpy)
@@ -374,7 +376,7 @@ class BehaviorTask(BaseTask):
             # TODO: How to handle systems as part of obs?
             if obj_exist:
                 low_dim_obs[f"{obj.bddl_inst}_real"] = np.array([1.0])
-                low_dim_obs[f"{obj.bddl_inst}_pos"] = obj.states[Pose].get_value()[0]
+                low_dim_obs[f"{obj.bddl_inst}_pos"] = objs_pose[obj][0]
                 low_dim_obs[f"{obj.bddl_inst}_ori_cos"] = obj_rpy_cos
                 low_dim_obs[f"{obj.bddl_inst}_ori_sin"] = obj_rpy_sin
                 if obj.name != agent.name:
@@ -13,7 +13,7 @@ from omnigibson.termination_conditions.falling import Falling
 from omnigibson.termination_conditions.point_goal import PointGoal
 from omnigibson.termination_conditions.timeout import Timeout
 from omnigibson.utils.python_utils import classproperty, assert_valid_key
-from omnigibson.utils.sim_utils import land_object, test_valid_pose
+from omnigibson.utils.sim_utils import land_object, test_valid_poses
 import omnigibson.utils.transform_utils as T
 from omnigibson.utils.ui_utils import create_module_logger
 
@@ -305,13 +305,25 @@ class PointNavigationTask(BaseTask):
         # We attempt to sample valid initial poses and goal positions
         success, max_trials = False, 100
 
+        # Checking poses does not modify the scene, so we only need to dump the state once for all trials
+        state = og.sim.scene.dump_state(serialized=False)
+
+        # Buffers for the poses to check, which are re-filled in-place during each trial
+        positions, quats = np.zeros((2, 3)), [None, None]
+
         initial_pos, initial_quat, goal_pos = None, None, None
         for i in range(max_trials):
             initial_pos, initial_quat, goal_pos = self._sample_initial_pose_and_goal_pos(env)
+            positions[0], positions[1], quats[0] = initial_pos, goal_pos, initial_quat
             # Make sure the sampled robot start pose and goal position are both collision-free
-            success = test_valid_pose(
-                env.robots[self._robot_idn], initial_pos, initial_quat, env.initial_pos_z_offset
-            ) and test_valid_pose(env.robots[self._robot_idn], goal_pos, None, env.initial_pos_z_offset)
+            success = test_valid_poses(
+                obj=env.robots[self._robot_idn],
+                positions=positions,
+                quats=quats,
+                z_offset=env.initial_pos_z_offset,
+                early_exit=True,
+                state=state,
+            ).all()
 
             # Don't need to continue iterating if we succeeded
             if success:
@@ -364,19 +376,24 @@ class PointNavigationTask(BaseTask):
         Returns:
             3-array: (x,y,z) position in self._robot_idn agent's local frame
         """
-        delta_pos_global = np.array(pos) - env.robots[self._robot_idn].states[Pose].get_value()[0]
-        return T.quat2mat(env.robots[self._robot_idn].states[Pose].get_value()[1]).T @ delta_pos_global
+        robot_pos, robot_quat = env.robots[self._robot_idn].states[Pose].get_value()
+        delta_pos_global = np.array(pos) - robot_pos
+        return T.quat2mat(robot_quat).T @ delta_pos_global
 
     def _get_obs(self, env):
+        # Query the robot pose once and share its inverse rotation between the goal and velocity transforms
+        robot = env.robots[self._robot_idn]
+        robot_pos, robot_quat = robot.states[Pose].get_value()
+        ori_t = T.quat2mat(robot_quat).T
+
         # Get relative position of goal with respect to the current agent position
-        xy_pos_to_goal = self._global_pos_to_robot_frame(env, self._goal_pos)[:2]
+        xy_pos_to_goal = (ori_t @ (np.array(self._goal_pos) - robot_pos))[:2]
         if self._goal_in_polar:
             xy_pos_to_goal = np.array(T.cartesian_to_polar(*xy_pos_to_goal))
 
         # linear velocity and angular velocity
-        ori_t = T.quat2mat(env.robots[self._robot_idn].states[Pose].get_value()[1]).T
-        lin_vel = ori_t @ env.robots[self._robot_idn].get_linear_velocity()
-        ang_vel = ori_t @ env.robots[self._robot_idn].get_angular_velocity()
+        lin_vel = ori_t @ robot.get_linear_velocity()
+        ang_vel = ori_t @ robot.get_angular_velocity()
 
         # Compose observation dict
         low_dim_obs = dict(
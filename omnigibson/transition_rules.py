@@ -386,7 +386,7 @@ class TouchingAnyCondition(RuleCondition):
             # Manually check contact
             filter_2_bodies = set.union(*(self._filter_2_bodies[obj] for obj in object_candidates[self._filter_2_name]))
             for obj in object_candidates[self._filter_1_name]:
-                if len(obj.states[ContactBodies].get_value().intersection(filter_2_bodies)) > 0:
+                if not obj.states[ContactBodies].get_value().isdisjoint(filter_2_bodies):
                     objs.append(obj)
 
         # Update candidates
@@ -739,7 +739,7 @@ class SlicingRule(BaseTransitionRule):
                 scale = np.abs(T.quat2mat(part_bb_orn) @ sliceable_obj.scale)
 
                 # Calculate global part bounding box pose.
-                part_bb_pos = pos + T.quat2mat(orn) @ (part_bb_pos * scale)
+                part_bb_pos = pos + T.quat_apply(orn, part_bb_pos * scale)
                 part_bb_orn = T.quat_multiply(orn, part_bb_orn)
                 part_obj_name = f"half_{sliceable_obj.name}_{i}"
                 part_obj = DatasetObject(
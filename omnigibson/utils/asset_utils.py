@@ -14,6 +14,7 @@ import yaml
 import progressbar
 import omnigibson as og
 from omnigibson.macros import gm
+from omnigibson.utils.config_utils import YamlLoader, YamlDumper
 from omnigibson.utils.ui_utils import create_module_logger
 if os.getenv("OMNIGIBSON_NO_OMNIVERSE", default=0) != "1":
     from pxr import Usd
@@ -423,7 +424,7 @@ def change_data_path():
     Changes the data paths for this repo
     """
     with open(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "global_config.yaml")) as f:
-        global_config = yaml.load(f, Loader=yaml.FullLoader)
+        global_config = yaml.load(f, Loader=YamlLoader)
     print("Current dataset path:")
     for k, v in global_config.items():
         print("{}: {}".format(k, v))
@@ -437,7 +438,7 @@ def change_data_path():
     response = input("Save? [y/n]")
     if response == "y":
         with open(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "global_config.yaml"), "w") as f:
-            yaml.dump(global_config, f)
+            yaml.dump(global_config, f, Dumper=YamlDumper)
 
 
 def decrypt_file(encrypted_filename, decrypted_filename):
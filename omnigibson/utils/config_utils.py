@@ -1,10 +1,29 @@
 import collections.abc
+from collections import OrderedDict
+from copy import deepcopy
 import json
 import os
 import numpy as np
 import yaml
 
 from omnigibson import example_config_path
+from omnigibson.macros import create_module_macros
+
+# Create settings for this module
+m = create_module_macros(module_path=__file__)
+
+# Maximum number of parsed yaml configs to keep cached; the least recently used entry is evicted past this size
+m.MAX_PARSED_CONFIG_CACHE_SIZE = 100
+
+# Use the libyaml-backed (C) loader / dumper if PyYAML was built with it, since they are much faster than the pure-python ones
+try:
+    from yaml import CSafeLoader as YamlLoader, CDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, Dumper as YamlDumper
+
+# LRU cache mapping yaml config file path to ((mtime, size), parsed config), so that repeatedly loaded configs are only
+# re-parsed when the underlying file changes
+_PARSED_CONFIG_CACHE = OrderedDict()
 
 # File I/O related
 
@@ -30,9 +49,22 @@ def parse_config(config):
                 config
             )
         )
-    with open(config, "r") as f:
-        config_data = yaml.load(f, Loader=yaml.FullLoader)
-    return config_data
+    stat = os.stat(config)
+    file_key = (stat.st_mtime_ns, stat.st_size)
+    cached = _PARSED_CONFIG_CACHE.get(config, None)
+    if cached is None or cached[0] != file_key:
+        with open(config, "r") as f:
+            config_data = yaml.load(f, Loader=YamlLoader)
+        _PARSED_CONFIG_CACHE[config] = (file_key, config_data)
+        _PARSED_CONFIG_CACHE.move_to_end(config)
+        while len(_PARSED_CONFIG_CACHE) > m.MAX_PARSED_CONFIG_CACHE_SIZE:
+            _PARSED_CONFIG_CACHE.popitem(last=False)
+    else:
+        config_data = cached[1]
+        _PARSED_CONFIG_CACHE.move_to_end(config)
+
+    # Return a copy so that callers can freely modify the returned config without corrupting the cache
+    return deepcopy(config_data)
 
 
 def parse_str_config(config):
@@ -45,7 +77,7 @@ def parse_str_config(config):
     Returns:
         dict: Parsed config
     """
-    return yaml.safe_load(config)
+    return yaml.load(config, Loader=YamlLoader)
 
 
 def dump_config(config):
@@ -58,7 +90,7 @@ def dump_config(config):
     Returns:
         str: Config as a string
     """
-    return yaml.dump(config)
+    return yaml.dump(config, Dumper=YamlDumper)
 
 
 def load_default_config():
@@ -31,11 +31,12 @@ def sample_stable_orientations(obj, n_samples=10, drop_aabb_offset=0.1):
     stable_orientations = np.zeros_like(drop_orientations)
     for i, drop_orientation in enumerate(drop_orientations):
         # Sample orientation, drop, wait to stabilize, then record
-        pos = drop_pos + T.quat2mat(drop_orientation) @ center_offset
+        pos = drop_pos + T.quat_apply(drop_orientation, center_offset)
         obj.set_position_orientation(pos, drop_orientation)
         obj.keep_still()
+        # Only physics needs to settle here, so skip rendering for these steps
         for j in range(25):
-            og.sim.step()
+            og.sim.step(render=False)
         stable_orientations[i] = obj.get_orientation()
 
     return stable_orientations
@@ -1,9 +1,10 @@
+import itertools
 import numpy as np
 from collections import namedtuple
 from collections.abc import Iterable
 
 import omnigibson as og
-from omnigibson.macros import gm
+from omnigibson.macros import create_module_macros, gm
 from omnigibson.utils import python_utils
 import omnigibson.utils.transform_utils as T
 from omnigibson.utils.usd_utils import BoundingBoxAPI
@@ -15,6 +16,12 @@ from omnigibson.utils.ui_utils import create_module_logger
 # Create module logger
 log = create_module_logger(module_name=__name__)
 
+# Create settings for this module
+m = create_module_macros(module_path=__file__)
+
+# Padding applied to AABBs when coarsely checking for collisions before running a full physics collision check
+m.COARSE_COLLISION_AABB_MARGIN = 0.05
+
 # Raw Body Contact Information
 # See https://docs.omniverse.nvidia.com/py/isaacsim/source/extensions/omni.isaac.contact_sensor/docs/index.html?highlight=contact%20sensor#omni.isaac.contact_sensor._contact_sensor.CsRawData for more info.
 CsRawData = namedtuple("RawBodyData", ["time", "dt", "body0", "body1", "position", "normal", "impulse"])
@@ -280,10 +287,12 @@ def place_base_pose(obj, pos, quat=None, z_offset=None):
     lower, _ = obj.states[AABB].get_value()
     cur_pos = obj.get_position()
     z_diff = cur_pos[2] - lower[2]
-    obj.set_position_orientation(pos + np.array([0, 0, z_diff if z_offset is None else z_diff + z_offset]), quat)
+    pos = np.array(pos, dtype=float)
+    pos[2] += z_diff if z_offset is None else z_diff + z_offset
+    obj.set_position_orientation(pos, quat)
 
 
-def test_valid_pose(obj, pos, quat=None, z_offset=None):
+def test_valid_pose(obj, pos, quat=None, z_offset=None, state=None):
     """
     Test if the object can be placed with no collision.
 
@@ -293,28 +302,220 @@ def test_valid_pose(obj, pos, quat=None, z_offset=None):
         quat (None or 4-array): Optional (x,y,z,w) quaternion orientation when placing the object.
             If None, the object's current orientation will be used
         z_offset (None or float): Optional additional z_offset to apply
+        state (None or dict): If specified, non-serialized scene state (from og.sim.scene.dump_state()) to restore
+            after checking the pose. This should be the current scene state, and can be passed in to avoid
+            re-dumping the state when testing many poses in a row. If None, the current state will be dumped
 
     Returns:
         bool: Whether the placed object position is valid
     """
+    return bool(test_valid_poses(obj=obj, positions=[pos], quats=[quat], z_offset=z_offset, state=state)[0])
+
+
+def compute_placement_aabbs(obj, positions, quats=None):
+    """
+    Computes conservative world-frame AABBs of object @obj if it were placed at each of the poses specified by
+    @positions and @quats. Each AABB bounds the rotated corners of the object's current AABB, so it is guaranteed to
+    contain the object, but may be larger than the object's true AABB at that pose.
+
+    Args:
+        obj (BaseObject): Object whose AABBs should be computed
+        positions ((N, 3)-array): Global (x,y,z) root link locations of the object
+        quats (None or (N, 4)-array or list of (None or 4-array)): Optional (x,y,z,w) quaternion orientations of the
+            object, one per position. If None (or an individual entry is None), the object's current orientation
+            will be used
+
+    Returns:
+        2-tuple:
+            - (N, 3)-array: (x,y,z) lower corners of the bounding boxes
+            - (N, 3)-array: (x,y,z) upper corners of the bounding boxes
+    """
+    # avoid circular dependency
+    from omnigibson.object_states import AABB
+
+    positions = np.array(positions, dtype=float).reshape(-1, 3)
+    lower, upper = obj.states[AABB].get_value()
+    cur_pos, cur_quat = obj.get_position_orientation()
+
+    # Corners of the current AABB, expressed relative to the object's current position
+    corners = np.array(list(itertools.product(*zip(lower, upper)))) - cur_pos
+
+    if quats is None:
+        # Orientation doesn't change, so we simply translate the corners
+        new_corners = positions.reshape(-1, 1, 3) + corners
+    else:
+        # Rotate the corners by the relative rotation between the current and each desired orientation, batched
+        quats = np.array([cur_quat if quat is None else quat for quat in quats], dtype=float)
+        rel_mats = T.quat2mat(quats) @ T.quat2mat(cur_quat).T
+        new_corners = positions.reshape(-1, 1, 3) + np.einsum("nij,kj->nki", rel_mats, corners)
+
+    return new_corners.min(axis=1), new_corners.max(axis=1)
+
+
+def count_aabb_overlaps(lower, upper, obstacles_lower, obstacles_upper, margin=0.0):
+    """
+    Counts how many of the obstacle AABBs specified by @obstacles_lower and @obstacles_upper each of the AABBs
+    specified by @lower and @upper overlaps with. All AABBs are checked against each other at once.
+
+    Args:
+        lower ((N, 3)-array): (x,y,z) lower corners of the bounding boxes to check
+        upper ((N, 3)-array): (x,y,z) upper corners of the bounding boxes to check
+        obstacles_lower ((M, 3)-array): (x,y,z) lower corners of the obstacle bounding boxes
+        obstacles_upper ((M, 3)-array): (x,y,z) upper corners of the obstacle bounding boxes
+        margin (float): Padding to apply to each obstacle AABB when checking for overlap
+
+    Returns:
+        n-array: (N,) integer array, where each entry is the number of obstacles the corresponding AABB overlaps with
+    """
+    lower, upper = np.asarray(lower).reshape(-1, 1, 3), np.asarray(upper).reshape(-1, 1, 3)
+    obstacles_lower, obstacles_upper = np.asarray(obstacles_lower).reshape(1, -1, 3), np.asarray(obstacles_upper).reshape(1, -1, 3)
+    overlaps = np.all((lower <= obstacles_upper + margin) & (upper >= obstacles_lower - margin), axis=-1)
+    return overlaps.sum(axis=-1)
+
+
+def get_coarse_collision_obstacle_aabbs(obj=None):
+    """
+    Computes the obstacle AABBs used by the coarse collision check in test_valid_poses(). These consist of the scene's
+    (cached) static collision AABBs, as well as one AABB per collision link of every other non-visual-only object.
+
+    Computing the non-static AABBs requires querying every such object, so when checking poses over multiple
+    test_valid_poses() calls, this should be called once and passed in to each call, as long as none of the
+    obstacles move in between.
+
+    Args:
+        obj (None or BaseObject): If specified, object to exclude from the obstacles (i.e.: the object being placed)
+
+    Returns:
+        2-tuple:
+            - (M, 3)-array: (x,y,z) lower corners of the obstacle bounding boxes
+            - (M, 3)-array: (x,y,z) upper corners of the obstacle bounding boxes
+    """
+    # Static geometry AABBs are cached by the scene, so we only need to compute AABBs for all other objects
+    # (including articulated fixed-base objects, whose links can move)
+    static_names = {o.name for o in og.sim.scene.static_collision_objects}
+    static_lower, static_upper = og.sim.scene.static_collision_aabbs
+    lowers, uppers = [], []
+    for o in og.sim.scene.objects:
+        if o is obj or o.visual_only or o.name in static_names:
+            continue
+        for link in o.links.values():
+            if link.has_collision_meshes:
+                lower, upper = link.aabb
+                lowers.append(lower)
+                uppers.append(upper)
+    return np.concatenate([static_lower, np.array(lowers).reshape(-1, 3)], axis=0), \
+        np.concatenate([static_upper, np.array(uppers).reshape(-1, 3)], axis=0)
+
+
+def test_valid_poses(
+        obj,
+        positions,
+        quats=None,
+        z_offset=None,
+        early_exit=False,
+        state=None,
+        coarse_check=False,
+        obstacle_aabbs=None,
+):
+    """
+    Test if the object can be placed with no collision at each of the poses specified by @positions and @quats.
+
+    This is a batched version of test_valid_pose(): the simulator state is only dumped once for the whole batch, and
+    the object's base z-offset is only computed once and applied to all positions simultaneously.
+
+    Args:
+        obj (BaseObject): Object to place in the environment
+        positions ((N, 3)-array): Global (x,y,z) locations to place the object
+        quats (None or (N, 4)-array or list of (None or 4-array)): Optional (x,y,z,w) quaternion orientations when
+            placing the object, one per position. If None (or an individual entry is None), the object's current
+            orientation will be used
+        z_offset (None or float): Optional additional z_offset to apply
+        early_exit (bool): Whether to stop testing as soon as the first pose in collision is found. If True, all
+            remaining untested poses will be marked as invalid, and poses that are more likely to be in collision
+            (i.e.: whose AABBs overlap with the most obstacles during the coarse check) will be tested first
+        state (None or dict): If specified, non-serialized scene state (from og.sim.scene.dump_state()) to restore
+            after checking each pose. This should be the current scene state, and can be passed in to avoid
+            re-dumping the state across multiple calls. If None, the current state will be dumped
+        coarse_check (bool): Whether to first run a coarse AABB check between the object at each pose and all other
+            non-visual-only objects and static geometry in the scene. Poses whose AABB does not overlap with any of
+            these AABBs are marked as valid without running the (expensive) physics check. Note that this check does
+            NOT account for particles (macro physical particles or fluids, which are not scene objects) or for
+            self-collisions, so it should only be enabled when those can be ignored. It is skipped in scenes which do
+            not support it (see Scene.coarse_collision_check_supported)
+        obstacle_aabbs (None or 2-tuple): If specified, precomputed obstacle AABBs (lower and upper corners) from
+            get_coarse_collision_obstacle_aabbs() to use for the coarse check, which can be passed in to avoid
+            re-computing them across multiple calls. If None, they will be computed. Only used if @coarse_check is set
+
+    Returns:
+        n-array: (N,) boolean array, where each entry is whether the corresponding placed object pose is valid
+    """
+    # avoid circular dependency
+    from omnigibson.object_states import AABB
+
     # Make sure sim is playing
     assert og.sim.is_playing(), "Cannot test valid pose while sim is not playing!"
 
-    # Store state before checking object position
-    state = og.sim.scene.dump_state(serialized=False)
+    # Copy the positions once, since they get shifted in-place below and the caller may re-use its own buffer
+    positions = np.array(positions, dtype=float).reshape(-1, 3)
+    n_poses = len(positions)
+    quats = [None] * n_poses if quats is None else quats
+    assert len(quats) == n_poses, \
+        f"Got mismatched number of positions and quaternions! positions: {n_poses}, quats: {len(quats)}"
+    valid = np.zeros(n_poses, dtype=bool)
 
-    # Set the pose of the object
-    place_base_pose(obj, pos, quat, z_offset)
-    obj.keep_still()
-
-    # Check whether we're in collision after taking a single physics step
-    in_collision = check_collision(prims=obj, step_physics=True)
+    # Store state before checking object position if it wasn't already provided
+    if state is None:
+        state = og.sim.scene.dump_state(serialized=False)
 
-    # Restore state after checking the collision
-    og.sim.load_state(state, serialized=False)
+    # Compute the object's base offset once and shift all positions at once -- this is equivalent to calling
+    # place_base_pose() for every pose, since the state (and hence the AABB) is restored after every check
+    lower, _ = obj.states[AABB].get_value()
+    z_diff = obj.get_position()[2] - lower[2]
+    positions[:, 2] += z_diff if z_offset is None else z_diff + z_offset
+
+    # Coarsely filter out poses that cannot possibly be in collision, so that we only need to run the physics
+    # collision check for the remaining ones
+    n_overlaps = np.ones(n_poses, dtype=int)
+    if coarse_check and og.sim.scene.coarse_collision_check_supported:
+        obstacles_lower, obstacles_upper = get_coarse_collision_obstacle_aabbs(obj=obj) if obstacle_aabbs is None \
+            else obstacle_aabbs
+        if len(obstacles_lower) == 0:
+            n_overlaps[:] = 0
+        else:
+            placement_lower, placement_upper = compute_placement_aabbs(obj=obj, positions=positions, quats=quats)
+            n_overlaps = count_aabb_overlaps(
+                lower=placement_lower,
+                upper=placement_upper,
+                obstacles_lower=obstacles_lower,
+                obstacles_upper=obstacles_upper,
+                margin=m.COARSE_COLLISION_AABB_MARGIN,
+            )
+
+    # Poses that passed the coarse check are assumed to be valid
+    valid[n_overlaps == 0] = True
+    check_idxs = np.nonzero(n_overlaps > 0)[0]
+
+    # If we're returning early, check the poses that are most likely to be in collision first, since any collision
+    # means we can stop immediately
+    if early_exit:
+        check_idxs = check_idxs[np.argsort(-n_overlaps[check_idxs], kind="stable")]
+
+    for i in check_idxs:
+        # Set the pose of the object
+        obj.set_position_orientation(positions[i], quats[i])
+        obj.keep_still()
+
+        # Check whether we're in collision after taking a single physics step
+        valid[i] = not check_collision(prims=obj, step_physics=True)
+
+        # Restore state after checking the collision
+        og.sim.load_state(state, serialized=False)
+
+        # Don't need to continue iterating if we found a colliding pose
+        if early_exit and not valid[i]:
+            break
 
-    # Valid if there are no collisions
-    return not in_collision
+    return valid
 
 
 def land_object(obj, pos, quat=None, z_offset=None):
@@ -342,7 +543,9 @@ def land_object(obj, pos, quat=None, z_offset=None):
     max_simulator_step = int(1.0 / og.sim.get_rendering_dt())
     for _ in range(max_simulator_step):
         # Run a sim step and see if we have any contacts
-        og.sim.step()
+        # Nothing observable happens while the object is settling, so we skip rendering and only step physics
+        # (callers that need updated observations, e.g. env.reset(), render afterwards anyways)
+        og.sim.step(render=False)
         land_success = check_collision(prims=obj)
         if land_success:
             # Once we're successful, we can break immediately
@@ -380,17 +380,115 @@ def mat2pose(hmat):
     return pos, orn
 
 
+# Maximum deviation of R @ R.T from identity for which a matrix is treated as already orthonormal
+_RMAT_ORTHONORMAL_TOL = 1e-6
+
+
+def _orthonormalize_rmat(rmat):
+    """
+    Projects matrices @rmat onto the nearest proper rotation matrices (in the Frobenius norm sense) via SVD
+
+    Args:
+        rmat (np.array): (..., 3, 3) matrices
+
+    Returns:
+        np.array: (..., 3, 3) proper rotation matrices
+    """
+    u, _, vt = np.linalg.svd(rmat)
+    # Flip the last singular vector where needed so that the result is a rotation (det = 1), not a reflection
+    u[..., -1] *= np.sign(np.linalg.det(u @ vt))[..., None]
+    return u @ vt
+
+
 def mat2quat(rmat):
     """
     Converts given rotation matrix to quaternion.
 
+    Matrices that are not orthonormal (e.g.: scaled or sheared) are first projected onto the nearest proper rotation
+    matrix, matching scipy's Rotation.from_matrix()
+
     Args:
         rmat (np.array): (..., 3, 3) rotation matrix
 
     Returns:
         np.array: (..., 4) (x,y,z,w) float quaternion angles
     """
-    return R.from_matrix(rmat).as_quat()
+    # Closed-form (batched) conversion, which avoids the overhead of constructing a scipy Rotation object.
+    # This follows the same numerically stable method as scipy's Rotation.from_matrix(), where the quaternion is
+    # computed from whichever of the diagonal terms / trace is largest
+    rmat = np.asarray(rmat, dtype=np.float64)
+
+    # Fast path for a single matrix, which avoids the overhead of the batched indexing below
+    if rmat.shape == (3, 3):
+        (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = rmat.tolist()
+        # Checking orthonormality on the raw floats is much cheaper than going through numpy for a single matrix
+        if max(
+            abs(m00 * m00 + m01 * m01 + m02 * m02 - 1),
+            abs(m10 * m10 + m11 * m11 + m12 * m12 - 1),
+            abs(m20 * m20 + m21 * m21 + m22 * m22 - 1),
+            abs(m00 * m10 + m01 * m11 + m02 * m12),
+            abs(m00 * m20 + m01 * m21 + m02 * m22),
+            abs(m10 * m20 + m11 * m21 + m12 * m22),
+        ) > _RMAT_ORTHONORMAL_TOL:
+            (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = _orthonormalize_rmat(rmat).tolist()
+        trace = m00 + m11 + m22
+        if m00 >= m11 and m00 >= m22 and m00 >= trace:
+            quat = [1 - trace + 2 * m00, m10 + m01, m20 + m02, m21 - m12]
+        elif m11 >= m22 and m11 >= trace:
+            quat = [m01 + m10, 1 - trace + 2 * m11, m21 + m12, m02 - m20]
+        elif m22 >= trace:
+            quat = [m02 + m20, m12 + m21, 1 - trace + 2 * m22, m10 - m01]
+        else:
+            quat = [m21 - m12, m02 - m20, m10 - m01, 1 + trace]
+        quat = np.array(quat)
+        return quat / math.sqrt(quat @ quat)
+
+    batch_shape = rmat.shape[:-2]
+    mats = rmat.reshape(-1, 3, 3)
+    n = len(mats)
+
+    # Only project the matrices that are not already orthonormal. The entries of R @ R.T are computed elementwise,
+    # since this is much faster than a batched matmul for many 3x3 matrices
+    m00, m01, m02, m10, m11, m12, m20, m21, m22 = mats.reshape(n, 9).T
+    err = np.abs(np.stack([
+        m00 * m00 + m01 * m01 + m02 * m02 - 1,
+        m10 * m10 + m11 * m11 + m12 * m12 - 1,
+        m20 * m20 + m21 * m21 + m22 * m22 - 1,
+        m00 * m10 + m01 * m11 + m02 * m12,
+        m00 * m20 + m01 * m21 + m02 * m22,
+        m10 * m20 + m11 * m21 + m12 * m22,
+    ])).max(axis=0, initial=0.0)
+    invalid = np.nonzero(err > _RMAT_ORTHONORMAL_TOL)[0]
+    if len(invalid) > 0:
+        mats = mats.copy()
+        mats[invalid] = _orthonormalize_rmat(mats[invalid])
+
+    decision = np.empty((n, 4))
+    decision[:, :3] = np.diagonal(mats, axis1=1, axis2=2)
+    decision[:, 3] = decision[:, :3].sum(axis=1)
+    choices = decision.argmax(axis=1)
+
+    quat = np.empty((n, 4))
+
+    # Case 1: One of the diagonal terms is the largest
+    ind = np.nonzero(choices != 3)[0]
+    i = choices[ind]
+    j = (i + 1) % 3
+    k = (j + 1) % 3
+    quat[ind, i] = 1 - decision[ind, 3] + 2 * mats[ind, i, i]
+    quat[ind, j] = mats[ind, j, i] + mats[ind, i, j]
+    quat[ind, k] = mats[ind, k, i] + mats[ind, i, k]
+    quat[ind, 3] = mats[ind, k, j] - mats[ind, j, k]
+
+    # Case 2: The trace is the largest
+    ind = np.nonzero(choices == 3)[0]
+    quat[ind, 0] = mats[ind, 2, 1] - mats[ind, 1, 2]
+    quat[ind, 1] = mats[ind, 0, 2] - mats[ind, 2, 0]
+    quat[ind, 2] = mats[ind, 1, 0] - mats[ind, 0, 1]
+    quat[ind, 3] = 1 + decision[ind, 3]
+
+    quat /= np.linalg.norm(quat, axis=1, keepdims=True)
+    return quat.reshape(batch_shape + (4,))
 
 
 def vec2quat(vec, up=(0, 0, 1.0)):
@@ -473,7 +571,77 @@ def quat2mat(quaternion):
     Returns:
         np.array: (..., 3, 3) rotation matrix
     """
-    return R.from_quat(quaternion).as_matrix()
+    # Closed-form (batched) conversion, which avoids the overhead of constructing a scipy Rotation object
+    q = np.asarray(quaternion, dtype=np.float64)
+
+    # Fast path for a single quaternion, which avoids the overhead of the batched indexing below
+    if q.shape == (4,):
+        x, y, z, w = (q / math.sqrt(q @ q)).tolist()
+        return np.array([
+            [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+            [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+            [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+        ])
+
+    q = q / np.linalg.norm(q, axis=-1, keepdims=True)
+    x, y, z, w = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+
+    xx, yy, zz = x * x, y * y, z * z
+    xy, xz, yz = x * y, x * z, y * z
+    xw, yw, zw = x * w, y * w, z * w
+
+    rmat = np.empty(q.shape[:-1] + (3, 3))
+    rmat[..., 0, 0] = 1 - 2 * (yy + zz)
+    rmat[..., 0, 1] = 2 * (xy - zw)
+    rmat[..., 0, 2] = 2 * (xz + yw)
+    rmat[..., 1, 0] = 2 * (xy + zw)
+    rmat[..., 1, 1] = 1 - 2 * (xx + zz)
+    rmat[..., 1, 2] = 2 * (yz - xw)
+    rmat[..., 2, 0] = 2 * (xz - yw)
+    rmat[..., 2, 1] = 2 * (yz + xw)
+    rmat[..., 2, 2] = 1 - 2 * (xx + yy)
+    return rmat
+
+
+def quat_apply(quat, vec):
+    """
+    Rotates vector(s) @vec by quaternion(s) @quat, without constructing the intermediate rotation matrix.
+    Equivalent to quat2mat(quat) @ vec.
+
+    Args:
+        quat (np.array): (..., 4) (x,y,z,w) float quaternion angles
+        vec (np.array): (..., 3) vector(s) to rotate. Broadcasts against @quat
+
+    Returns:
+        np.array: (..., 3) rotated vector(s)
+    """
+    q = np.asarray(quat, dtype=np.float64)
+    v = np.asarray(vec, dtype=np.float64)
+
+    # Fast path for a single quaternion and vector, which avoids the overhead of the batched indexing below
+    if q.shape == (4,) and v.shape == (3,):
+        x, y, z, w = (q / math.sqrt(q @ q)).tolist()
+        vx, vy, vz = v.tolist()
+        tx, ty, tz = 2 * (y * vz - z * vy), 2 * (z * vx - x * vz), 2 * (x * vy - y * vx)
+        return np.array([
+            vx + w * tx + (y * tz - z * ty),
+            vy + w * ty + (z * tx - x * tz),
+            vz + w * tz + (x * ty - y * tx),
+        ])
+
+    q = q / np.linalg.norm(q, axis=-1, keepdims=True)
+    x, y, z, w = q[..., 0:1], q[..., 1:2], q[..., 2:3], q[..., 3:4]
+    vx, vy, vz = v[..., 0:1], v[..., 1:2], v[..., 2:3]
+
+    # v' = v + w * t + q_xyz x t, where t = 2 * (q_xyz x v)
+    tx = 2 * (y * vz - z * vy)
+    ty = 2 * (z * vx - x * vz)
+    tz = 2 * (x * vy - y * vx)
+    return np.concatenate([
+        vx + w * tx + (y * tz - z * ty),
+        vy + w * ty + (z * tx - x * tz),
+        vz + w * tz + (x * ty - y * tx),
+    ], axis=-1)
 
 
 def quat2axisangle(quat):
@@ -519,20 +687,54 @@ def euler2quat(euler):
     return R.from_euler("xyz", euler).as_quat()
 
 
+# Tolerance (in radians) on the middle euler angle for treating a rotation as gimbal locked, matching scipy
+_EULER_GIMBAL_EPS = 1e-7
+
+
 def quat2euler(quat):
     """
-    Converts euler angles into quaternion form
+    Converts quaternion into euler angles
 
     Args:
-        quat (np.array): (x,y,z,w) float quaternion angles
+        quat (np.array): (..., 4) (x,y,z,w) float quaternion angles
 
     Returns:
-        np.array: (r,p,y) angles
+        np.array: (..., 3) (r,p,y) angles, following the extrinsic "xyz" convention
 
     Raises:
         AssertionError: [Invalid input shape]
     """
-    return R.from_quat(quat).as_euler("xyz")
+    # Closed-form (batched) conversion computed directly from the quaternion components, which avoids both the
+    # overhead of constructing a scipy Rotation object and materializing the intermediate rotation matrix
+    q = np.asarray(quat, dtype=np.float64)
+    assert q.shape[-1] == 4, "Invalid shaped quat {}".format(quat)
+
+    # Fast path for a single quaternion, which avoids the overhead of the batched indexing below
+    if q.shape == (4,):
+        x, y, z, w = (q / math.sqrt(q @ q)).tolist()
+        r00, r10 = 1 - 2 * (y * y + z * z), 2 * (x * y + z * w)
+        pitch = math.atan2(2 * (y * w - x * z), math.sqrt(r00 * r00 + r10 * r10))
+        if abs(abs(pitch) - np.pi / 2) <= _EULER_GIMBAL_EPS:
+            # Gimbal lock -- following scipy, yaw is set to zero and the full rotation is attributed to roll
+            return np.array([math.atan2(2 * (x * w - y * z), 1 - 2 * (x * x + z * z)), pitch, 0.0])
+        return np.array([math.atan2(2 * (y * z + x * w), 1 - 2 * (x * x + y * y)), pitch, math.atan2(r10, r00)])
+
+    q = q / np.linalg.norm(q, axis=-1, keepdims=True)
+    x, y, z, w = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+
+    # Pitch is computed with atan2 rather than asin, which stays well-conditioned near +/- pi/2
+    r00, r10 = 1 - 2 * (y * y + z * z), 2 * (x * y + z * w)
+    roll = np.arctan2(2 * (y * z + x * w), 1 - 2 * (x * x + y * y))
+    pitch = np.arctan2(2 * (y * w - x * z), np.sqrt(r00 * r00 + r10 * r10))
+    yaw = np.arctan2(r10, r00)
+
+    # Gimbal lock -- following scipy, yaw is set to zero and the full rotation is attributed to roll
+    gimbal = np.abs(np.abs(pitch) - np.pi / 2) <= _EULER_GIMBAL_EPS
+    if np.any(gimbal):
+        roll = np.where(gimbal, np.arctan2(2 * (x * w - y * z), 1 - 2 * (x * x + z * z)), roll)
+        yaw = np.where(gimbal, 0.0, yaw)
+
+    return np.stack([roll, pitch, yaw], axis=-1)
 
 
 def pose_in_A_to_pose_in_B(pose_A, pose_A_in_B):
@@ -1022,7 +1224,9 @@ def vecs2quat(vec0, vec1, normalized=False):
 
 def l2_distance(v1, v2):
     """Returns the L2 distance between vector v1 and v2."""
-    return np.linalg.norm(np.array(v1) - np.array(v2))
+    # Avoid copying the inputs and going through the general-purpose np.linalg.norm, since this is called per-step
+    diff = (np.asarray(v1) - np.asarray(v2)).ravel()
+    return math.sqrt(diff @ diff)
 
 
 def frustum(left, right, bottom, top, znear, zfar):
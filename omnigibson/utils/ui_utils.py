@@ -261,6 +261,23 @@ class CameraMover:
         self.light_val = gm.FORCE_LIGHT_INTENSITY
         self.save_dir = save_dir
 
+        # Keypress mappings are fixed for this camera mover, so build them once up front rather than once per keypress.
+        # Movement is stored as unit directions so that changes to @delta are still respected
+        self._input_to_function = {
+            carb.input.KeyboardInput.O: lambda: self.record_image(fpath=None),
+            carb.input.KeyboardInput.P: lambda: self.print_cam_pose(),
+            carb.input.KeyboardInput.KEY_9: lambda: self.change_light(delta=-2e4),
+            carb.input.KeyboardInput.KEY_0: lambda: self.change_light(delta=2e4),
+        }
+        self._input_to_direction = {
+            carb.input.KeyboardInput.D: np.array([1.0, 0, 0]),
+            carb.input.KeyboardInput.A: np.array([-1.0, 0, 0]),
+            carb.input.KeyboardInput.W: np.array([0, 0, -1.0]),
+            carb.input.KeyboardInput.S: np.array([0, 0, 1.0]),
+            carb.input.KeyboardInput.T: np.array([0, 1.0, 0]),
+            carb.input.KeyboardInput.G: np.array([0, -1.0, 0]),
+        }
+
         self._appwindow = omni.appwindow.get_default_app_window()
         self._input = carb.input.acquire_input_interface()
         self._keyboard = self._appwindow.get_keyboard()
@@ -464,12 +481,7 @@ class CameraMover:
         Returns:
             dict: Mapping from relevant keypresses to corresponding function call to use
         """
-        return {
-            carb.input.KeyboardInput.O: lambda: self.record_image(fpath=None),
-            carb.input.KeyboardInput.P: lambda: self.print_cam_pose(),
-            carb.input.KeyboardInput.KEY_9: lambda: self.change_light(delta=-2e4),
-            carb.input.KeyboardInput.KEY_0: lambda: self.change_light(delta=2e4),
-        }
+        return self._input_to_function
 
     @property
     def input_to_command(self):
@@ -477,14 +489,7 @@ class CameraMover:
         Returns:
             dict: Mapping from relevant keypresses to corresponding delta command to apply to the camera pose
         """
-        return {
-            carb.input.KeyboardInput.D: np.array([self.delta, 0, 0]),
-            carb.input.KeyboardInput.A: np.array([-self.delta, 0, 0]),
-            carb.input.KeyboardInput.W: np.array([0, 0, -self.delta]),
-            carb.input.KeyboardInput.S: np.array([0, 0, self.delta]),
-            carb.input.KeyboardInput.T: np.array([0, self.delta, 0]),
-            carb.input.KeyboardInput.G: np.array([0, -self.delta, 0]),
-        }
+        return {key: self.delta * direction for key, direction in self._input_to_direction.items()}
 
     def _sub_keyboard_event(self, event, *args, **kwargs):
         """
@@ -496,16 +501,18 @@ class CameraMover:
         if event.type == carb.input.KeyboardEventType.KEY_PRESS \
                 or event.type == carb.input.KeyboardEventType.KEY_REPEAT:
 
-            if event.type == carb.input.KeyboardEventType.KEY_PRESS and event.input in self.input_to_function:
-                self.input_to_function[event.input]()
+            function = self._input_to_function.get(event.input, None) \
+                if event.type == carb.input.KeyboardEventType.KEY_PRESS else None
+
+            if function is not None:
+                function()
 
             else:
-                command = self.input_to_command.get(event.input, None)
+                direction = self._input_to_direction.get(event.input, None)
 
-                if command is not None:
+                if direction is not None:
                     # Convert to world frame to move the camera
-                    transform = T.quat2mat(self.cam.get_orientation())
-                    delta_pos_global = transform @ command
+                    delta_pos_global = T.quat_apply(self.cam.get_orientation(), self.delta * direction)
                     self.cam.set_position(self.cam.get_position() + delta_pos_global)
 
         return True
@@ -0,0 +1,128 @@
+from omnigibson.object_states import AABB
+from omnigibson.objects import PrimitiveObject
+from omnigibson.utils import sim_utils
+from omnigibson.utils.sim_utils import compute_placement_aabbs, count_aabb_overlaps
+import omnigibson.utils.transform_utils as T
+import omnigibson as og
+
+from utils import og_test, place_obj_on_floor_plane
+
+import numpy as np
+
+
+def test_count_aabb_overlaps():
+    obstacles_lower = np.array([[0.0, 0.0, 0.0], [2.0, 0.0, 0.0]])
+    obstacles_upper = np.array([[1.0, 1.0, 1.0], [3.0, 1.0, 1.0]])
+
+    # Overlapping both obstacles, one obstacle, touching one obstacle, and no obstacles
+    lower = np.array([[0.5, 0.5, 0.5], [2.5, 0.5, 0.5], [1.0, 0.0, 0.0], [1.2, 0.0, 0.0]])
+    upper = np.array([[2.5, 0.7, 0.7], [2.7, 0.7, 0.7], [1.1, 1.0, 1.0], [1.8, 1.0, 1.0]])
+    assert np.all(count_aabb_overlaps(lower, upper, obstacles_lower, obstacles_upper) == [2, 1, 1, 0])
+
+    # The margin pads each obstacle, so nearby AABBs should now count as overlapping
+    assert np.all(count_aabb_overlaps(lower, upper, obstacles_lower, obstacles_upper, margin=0.25) == [2, 1, 1, 2])
+
+    # Single AABB and empty obstacle inputs
+    assert np.all(count_aabb_overlaps(lower[0], upper[0], obstacles_lower, obstacles_upper) == [2])
+    assert np.all(count_aabb_overlaps(lower, upper, np.zeros((0, 3)), np.zeros((0, 3))) == 0)
+
+
+@og_test
+def test_compute_placement_aabbs():
+    bowl = og.sim.scene.object_registry("name", "bowl")
+    pos, quat = bowl.get_position_orientation()
+    lower, upper = bowl.states[AABB].get_value()
+
+    # Translating the object should translate its AABB
+    offsets = np.array([[0.0, 0.0, 0.0], [1.0, -2.0, 0.5]])
+    new_lower, new_upper = compute_placement_aabbs(bowl, pos + offsets)
+    assert np.allclose(new_lower, lower + offsets)
+    assert np.allclose(new_upper, upper + offsets)
+
+    # Keeping the current orientation should give the same result as not specifying one
+    same_lower, same_upper = compute_placement_aabbs(bowl, pos + offsets, quats=[quat, None])
+    assert np.allclose(same_lower, new_lower)
+    assert np.allclose(same_upper, new_upper)
+
+    # A rotated placement must still contain all of the rotated AABB corners of the object
+    new_quat = T.quat_multiply(T.euler2quat([0.0, 0.0, np.pi / 4]), quat)
+    rot_lower, rot_upper = compute_placement_aabbs(bowl, [pos], quats=[new_quat])
+    corners = np.array(np.meshgrid(*zip(lower, upper))).reshape(3, -1).T - pos
+    rel_mat = T.quat2mat(new_quat) @ T.quat2mat(quat).T
+    rotated_corners = pos + corners @ rel_mat.T
+    assert np.all(rotated_corners >= rot_lower - 1e-6)
+    assert np.all(rotated_corners <= rot_upper + 1e-6)
+
+
+@og_test
+def test_valid_poses_batched():
+    breakfast_table = og.sim.scene.object_registry("name", "breakfast_table")
+    bowl = og.sim.scene.object_registry("name", "bowl")
+
+    place_obj_on_floor_plane(breakfast_table)
+    place_obj_on_floor_plane(bowl, x_offset=3.0)
+    for _ in range(5):
+        og.sim.step()
+
+    # One free pose far away from the table, and one colliding pose sunk into the table top
+    table_lower, table_upper = breakfast_table.aabb
+    free_pos = np.array([-3.0, -3.0, 0.1])
+    colliding_pos = np.array([*((table_lower[:2] + table_upper[:2]) / 2.0), table_upper[2] - 0.05])
+    positions = np.array([free_pos, colliding_pos, free_pos])
+
+    state = og.sim.dump_state(serialized=True)
+
+    # Each per-pose result should match the single-pose version
+    valid = sim_utils.test_valid_poses(obj=bowl, positions=positions)
+    assert np.all(valid == [True, False, True])
+    assert np.all(valid == [sim_utils.test_valid_pose(obj=bowl, pos=pos) for pos in positions])
+
+    # Exiting early should mark all poses after the first colliding one as invalid without testing them
+    assert np.all(sim_utils.test_valid_poses(obj=bowl, positions=positions, early_exit=True) == [True, False, False])
+
+    # Passing in the current state should give the same results as dumping it internally
+    scene_state = og.sim.scene.dump_state(serialized=False)
+    assert np.all(sim_utils.test_valid_poses(obj=bowl, positions=positions, state=scene_state) == valid)
+
+    # None of the checks should have modified the scene state
+    assert np.allclose(og.sim.dump_state(serialized=True), state, atol=1e-4)
+
+
+@og_test
+def test_static_collision_aabbs():
+    scene = og.sim.scene
+    bowl = og.sim.scene.object_registry("name", "bowl")
+    box = PrimitiveObject(name="static_box", primitive_type="Cube", size=0.5, fixed_base=True)
+    og.sim.import_object(box)
+    box.set_position([5.0, 5.0, 0.25])
+    og.sim.step()
+    state = og.sim.dump_state(serialized=False)
+
+    def box_in_aabbs(aabbs):
+        box_lower, box_upper = box.aabb
+        lower, upper = aabbs
+        return np.any(np.all(np.isclose(lower, box_lower, atol=1e-3) & np.isclose(upper, box_upper, atol=1e-3), axis=-1))
+
+    # The cache should include the fixed box, and should be re-used while nothing static moves
+    aabbs = scene.static_collision_aabbs
+    assert box_in_aabbs(aabbs)
+    bowl.set_position([3.0, 3.0, 1.0])
+    assert scene.static_collision_aabbs is aabbs
+
+    # Moving the fixed box should clear the cache, and the recomputed AABBs should reflect its new pose
+    box.set_position([6.0, 5.0, 0.25])
+    new_aabbs = scene.static_collision_aabbs
+    assert new_aabbs is not aabbs
+    assert box_in_aabbs(new_aabbs)
+
+    # Loading a state in which the box is somewhere else should also clear the cache
+    og.sim.load_state(state, serialized=False)
+    loaded_aabbs = scene.static_collision_aabbs
+    assert loaded_aabbs is not new_aabbs
+    assert box_in_aabbs(loaded_aabbs)
+
+    # Loading a state that doesn't move the box should keep the cache
+    og.sim.load_state(state, serialized=False)
+    assert scene.static_collision_aabbs is loaded_aabbs
+
+    og.sim.remove_object(box)
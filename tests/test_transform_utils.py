@@ -0,0 +1,91 @@
+import omnigibson.utils.transform_utils as T
+from scipy.spatial.transform import Rotation as R
+
+import pytest
+import numpy as np
+
+
+def _random_quats(n, seed=0):
+    return R.random(n, random_state=seed).as_quat()
+
+
+def _assert_quats_close(q1, q2, atol=1e-8):
+    # q and -q represent the same rotation
+    q1, q2 = np.asarray(q1), np.asarray(q2)
+    assert np.allclose(np.abs(np.sum(q1 * q2, axis=-1)), 1.0, atol=atol)
+
+
+def test_quat2mat():
+    quats = _random_quats(100)
+    mats = R.from_quat(quats).as_matrix()
+
+    # Batched and single inputs
+    assert np.allclose(T.quat2mat(quats), mats)
+    assert np.allclose(T.quat2mat(quats.reshape(10, 10, 4)), mats.reshape(10, 10, 3, 3))
+    for quat, mat in zip(quats[:10], mats[:10]):
+        assert np.allclose(T.quat2mat(quat), mat)
+
+    # Empty input
+    assert T.quat2mat(np.zeros((0, 4))).shape == (0, 3, 3)
+
+
+def test_mat2quat():
+    quats = _random_quats(100)
+    mats = R.from_quat(quats).as_matrix()
+
+    # Batched and single inputs
+    _assert_quats_close(T.mat2quat(mats), quats)
+    _assert_quats_close(T.mat2quat(mats.reshape(10, 10, 3, 3)), quats.reshape(10, 10, 4))
+    for mat, quat in zip(mats[:10], quats[:10]):
+        _assert_quats_close(T.mat2quat(mat), quat)
+
+    # Non-orthonormal matrices should be projected onto the nearest rotation, like scipy does
+    for scaled_mats in (mats * 1.5, mats @ np.diag([0.7, 1.3, 2.0])):
+        _assert_quats_close(T.mat2quat(scaled_mats), R.from_matrix(scaled_mats).as_quat(), atol=1e-6)
+        _assert_quats_close(T.mat2quat(scaled_mats[0]), R.from_matrix(scaled_mats[0]).as_quat(), atol=1e-6)
+
+    # Empty input
+    assert T.mat2quat(np.zeros((0, 3, 3))).shape == (0, 4)
+
+
+def test_quat2euler():
+    quats = _random_quats(100)
+    eulers = R.from_quat(quats).as_euler("xyz")
+
+    # Batched and single inputs
+    assert np.allclose(T.quat2euler(quats), eulers)
+    for quat, euler in zip(quats[:10], eulers[:10]):
+        assert np.allclose(T.quat2euler(quat), euler)
+
+    # Empty input
+    assert T.quat2euler(np.zeros((0, 4))).shape == (0, 3)
+
+
+@pytest.mark.parametrize("offset", [0.0, 1e-8, 1e-4])
+@pytest.mark.parametrize("sign", [1.0, -1.0])
+def test_quat2euler_gimbal_lock(offset, sign):
+    # Pitch at or near +/- pi/2, where roll and yaw become (nearly) degenerate
+    eulers = np.array([[0.3, sign * (np.pi / 2 - offset), -0.5], [-1.2, sign * (np.pi / 2 - offset), 2.0]])
+    quats = R.from_euler("xyz", eulers).as_quat()
+    ref_mats = R.from_quat(quats).as_matrix()
+
+    for out in (T.quat2euler(quats), np.array([T.quat2euler(quat) for quat in quats])):
+        # The recovered angles must represent the same rotation
+        assert np.allclose(R.from_euler("xyz", out).as_matrix(), ref_mats, atol=1e-7)
+        # Outside of the degenerate band, the angles themselves should match scipy
+        if offset > 1e-7:
+            assert np.allclose(out, R.from_quat(quats).as_euler("xyz"), atol=1e-6)
+
+
+def test_quat_apply():
+    quats = _random_quats(100)
+    vecs = np.random.default_rng(0).normal(size=(100, 3))
+    rots = R.from_quat(quats)
+
+    # Batched and single inputs
+    assert np.allclose(T.quat_apply(quats, vecs), rots.apply(vecs))
+    for quat, vec, rot in zip(quats[:10], vecs[:10], rots[:10]):
+        assert np.allclose(T.quat_apply(quat, vec), rot.apply(vec))
+
+    # A single quaternion applied to multiple vectors
+    assert np.allclose(T.quat_apply(quats[0], vecs), rots[0].apply(vecs))